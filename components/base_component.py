@@ -5,7 +5,7 @@
 
 from abc import ABC, abstractmethod
 import streamlit as st
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Type
 import json
 import textwrap
 from pathlib import Path
@@ -25,6 +25,13 @@ class BaseComponent(ABC):
         self.category = category
         self.metadata = self._load_metadata()
         self.params = {}
+        # 再実行のたびに生成しないよう、ウィジェットキーを事前に組み立てておく
+        self._keys = {
+            'copy_basic': f"copy_basic_{self.id}",
+            'copy_advanced': f"copy_advanced_{self.id}",
+            'copy_full': f"copy_full_{self.id}",
+        }
+        self._param_keys: Dict[str, str] = {}
         
     def _load_metadata(self) -> Dict[str, Any]:
         """コンポーネントのメタデータを読み込み"""
@@ -91,26 +98,34 @@ class BaseComponent(ABC):
         self.params = params
         return params
     
+    def _param_key(self, name: str) -> str:
+        """パラメータ用ウィジェットキーを取得（初回のみ生成してキャッシュ）"""
+        key = self._param_keys.get(name)
+        if key is None:
+            key = self._param_keys[name] = f"{self.id}_{name}"
+        return key
+    
     def _render_param_control(self, name: str, param_type: str, 
                              description: str, default: Any) -> Any:
         """個別パラメータコントロールをレンダリング"""
         
         # パラメータ名を人間が読みやすい形式に変換
         display_name = name.replace('_', ' ').title()
+        key = self._param_key(name)
         
         if param_type == 'str':
             return st.text_input(
                 f"{display_name}",
                 value=default or '',
                 help=description,
-                key=f"{self.id}_{name}"
+                key=key
             )
         elif param_type == 'int':
             return st.number_input(
                 f"{display_name}",
                 value=default or 0,
                 help=description,
-                key=f"{self.id}_{name}",
+                key=key,
                 step=1
             )
         elif param_type == 'float':
@@ -118,7 +133,7 @@ class BaseComponent(ABC):
                 f"{display_name}",
                 value=float(default or 0.0),
                 help=description,
-                key=f"{self.id}_{name}",
+                key=key,
                 step=0.1
             )
         elif param_type == 'bool':
@@ -126,7 +141,7 @@ class BaseComponent(ABC):
                 f"{display_name}",
                 value=default or False,
                 help=description,
-                key=f"{self.id}_{name}"
+                key=key
             )
         elif param_type == 'list':
             # リストの場合はテキストエリアで入力（カンマ区切り）
@@ -134,7 +149,7 @@ class BaseComponent(ABC):
                 f"{display_name}",
                 value=', '.join(default) if default else '',
                 help=f"{description} (カンマ区切りで入力)",
-                key=f"{self.id}_{name}"
+                key=key
             )
             return [item.strip() for item in text_value.split(',') if item.strip()]
         else:
@@ -143,7 +158,7 @@ class BaseComponent(ABC):
                 f"{display_name}",
                 value=str(default) if default else '',
                 help=description,
-                key=f"{self.id}_{name}"
+                key=key
             )
     
     def display_code(self, syntax_highlight: bool = True) -> None:
@@ -170,21 +185,21 @@ class BaseComponent(ABC):
             st.subheader("基本的な使い方")
             basic_code = self.get_code("basic")
             st.code(basic_code, language='python')
-            if st.button("📋 コピー", key=f"copy_basic_{self.id}"):
+            if st.button("📋 コピー", key=self._keys['copy_basic']):
                 st.success("コピーしました！")
         
         with tab3:
             st.subheader("応用的な使い方")
             advanced_code = self.get_code("advanced")
             st.code(advanced_code, language='python')
-            if st.button("📋 コピー", key=f"copy_advanced_{self.id}"):
+            if st.button("📋 コピー", key=self._keys['copy_advanced']):
                 st.success("コピーしました！")
         
         with tab4:
             st.subheader("完全なサンプルコード")
             full_code = self.get_code("full")
             st.code(full_code, language='python')
-            if st.button("📋 コピー", key=f"copy_full_{self.id}"):
+            if st.button("📋 コピー", key=self._keys['copy_full']):
                 st.success("コピーしました！")
     
     def render_info(self) -> None:
@@ -219,4 +234,20 @@ class BaseComponent(ABC):
     
     def get_import_statements(self) -> str:
         """必要なimport文を取得"""
-        return "import streamlit as st"
\ No newline at end of file
+        return "import streamlit as st"
+
+@st.cache_resource(show_spinner=False)
+def get_component(component_cls: Type[BaseComponent]) -> BaseComponent:
+    """
+    コンポーネントのインスタンスを取得（クラスごとに1つを共有）
+    
+    再実行のたびにメタデータの読み込みや初期化を繰り返さないよう、
+    インスタンスをst.cache_resourceでキャッシュする
+    
+    Args:
+        component_cls: BaseComponentのサブクラス
+    
+    Returns:
+        キャッシュされたコンポーネントのインスタンス
+    """
+    return component_cls()
@@ -59,8 +59,6 @@ class BasicCharts:
                 )
             else:
                 # Plotlyを使用（詳細な制御が必要な場合）
-                fig = go.Figure()
-                
                 if x is None:
                     x_data = data.index
                 else:
@@ -73,12 +71,13 @@ class BasicCharts:
                 else:
                     y_cols = y
                 
+                traces = []
                 # 色分けがある場合
                 if color and color in data.columns:
                     for value in data[color].unique():
                         mask = data[color] == value
                         for col in y_cols:
-                            fig.add_trace(go.Scatter(
+                            traces.append(go.Scatter(
                                 x=x_data[mask],
                                 y=data[mask][col],
                                 mode='lines',
@@ -87,19 +86,23 @@ class BasicCharts:
                 else:
                     # 各Y軸カラムに対してトレースを追加
                     for col in y_cols:
-                        fig.add_trace(go.Scatter(
+                        traces.append(go.Scatter(
                             x=x_data,
                             y=data[col],
                             mode='lines',
                             name=col
                         ))
                 
-                fig.update_layout(
-                    title=title,
-                    xaxis_title=x if x else "Index",
-                    yaxis_title="Value",
-                    height=height,
-                    hovermode='x unified'
+                # レイアウトは生成時に渡し、検証を1回で済ませる
+                fig = go.Figure(
+                    data=traces,
+                    layout=dict(
+                        title=title,
+                        xaxis_title=x if x else "Index",
+                        yaxis_title="Value",
+                        height=height,
+                        hovermode='x unified'
+                    )
                 )
                 
                 st.plotly_chart(
@@ -154,8 +157,6 @@ class BasicCharts:
                 )
             else:
                 # Plotlyを使用（詳細な制御が必要な場合）
-                fig = go.Figure()
-                
                 if x is None:
                     x_data = data.index
                 else:
@@ -173,28 +174,27 @@ class BasicCharts:
                 
                 # 水平/垂直の設定
                 if orientation == "horizontal":
-                    for col in y_cols:
-                        fig.add_trace(go.Bar(
-                            x=data[col],
-                            y=x_data,
-                            name=col,
-                            orientation='h'
-                        ))
+                    traces = [
+                        go.Bar(x=data[col], y=x_data, name=col, orientation='h')
+                        for col in y_cols
+                    ]
                 else:
-                    for col in y_cols:
-                        fig.add_trace(go.Bar(
-                            x=x_data,
-                            y=data[col],
-                            name=col
-                        ))
+                    traces = [
+                        go.Bar(x=x_data, y=data[col], name=col)
+                        for col in y_cols
+                    ]
                 
-                fig.update_layout(
-                    title=title,
-                    barmode=barmode,
-                    xaxis_title=x if x else "Index",
-                    yaxis_title="Value",
-                    height=height,
-                    hovermode='x unified'
+                # レイアウトは生成時に渡し、検証を1回で済ませる
+                fig = go.Figure(
+                    data=traces,
+                    layout=dict(
+                        title=title,
+                        barmode=barmode,
+                        xaxis_title=x if x else "Index",
+                        yaxis_title="Value",
+                        height=height,
+                        hovermode='x unified'
+                    )
                 )
                 
                 st.plotly_chart(
@@ -245,8 +245,6 @@ class BasicCharts:
                 )
             else:
                 # Plotlyを使用（詳細な制御が必要な場合）
-                fig = go.Figure()
-                
                 if x is None:
                     x_data = data.index
                 else:
@@ -263,22 +261,28 @@ class BasicCharts:
                 stackgroup = 'one' if stacked else None
                 
                 # 各Y軸カラムに対してトレースを追加
-                for col in y_cols:
-                    fig.add_trace(go.Scatter(
+                traces = [
+                    go.Scatter(
                         x=x_data,
                         y=data[col],
                         mode='lines',
                         name=col,
                         fill='tonexty' if stacked else 'tozeroy',
                         stackgroup=stackgroup
-                    ))
+                    )
+                    for col in y_cols
+                ]
                 
-                fig.update_layout(
-                    title=title,
-                    xaxis_title=x if x else "Index",
-                    yaxis_title="Value",
-                    height=height,
-                    hovermode='x unified'
+                # レイアウトは生成時に渡し、検証を1回で済ませる
+                fig = go.Figure(
+                    data=traces,
+                    layout=dict(
+                        title=title,
+                        xaxis_title=x if x else "Index",
+                        yaxis_title="Value",
+                        height=height,
+                        hovermode='x unified'
+                    )
                 )
                 
                 st.plotly_chart(
@@ -317,16 +321,17 @@ class ChartDataGenerator:
             freq='D'
         )
         
-        data = {}
-        for col in columns:
-            # トレンドとランダム成分を組み合わせる
-            trend = np.linspace(100, 150, days)
-            noise = np.random.normal(0, 10, days)
-            seasonal = 10 * np.sin(np.arange(days) * 2 * np.pi / 7)
-            data[col] = trend + noise + seasonal + np.random.randint(-5, 5)
-            data[col] = np.maximum(data[col], 0)  # 負の値を避ける
+        # トレンドと季節成分は全カラム共通なので一度だけ計算する
+        base = np.linspace(100, 150, days)
+        base += 10 * np.sin(np.arange(days) * 2 * np.pi / 7)
         
-        return pd.DataFrame(data, index=dates)
+        # ノイズ配列を出力バッファとして使い、各成分をインプレースで加算する
+        values = np.random.normal(0, 10, (len(columns), days))
+        values += base
+        values += np.random.randint(-5, 5, (len(columns), 1))
+        np.maximum(values, 0, out=values)  # 負の値を避ける
+        
+        return pd.DataFrame(values.T, index=dates, columns=columns)
     
     @staticmethod
     def generate_categorical_data(
@@ -369,17 +374,93 @@ class ChartDataGenerator:
         Returns:
             リアルタイムDataFrame
         """
-        # 現在時刻から過去に向かってpoints個の時刻を生成
-        now = datetime.now()
-        timestamps = [now - timedelta(seconds=i) for i in range(points-1, -1, -1)]
+        # 現在時刻から過去に向かってpoints個の時刻を1秒間隔で生成
+        timestamps = pd.date_range(end=pd.Timestamp.now(), periods=points, freq='s')
         
-        data = {}
-        for col in columns:
-            # ランダムウォーク（points個の値を生成）
-            values = np.cumsum(np.random.randn(points)) + 50
-            data[col] = values
+        # ランダムウォーク（全カラム分を一括で生成し、同じバッファ上で累積）
+        values = np.random.randn(len(columns), points)
+        np.cumsum(values, axis=1, out=values)
+        values += 50
         
-        return pd.DataFrame(data, index=pd.DatetimeIndex(timestamps))
+        return pd.DataFrame(values.T, index=timestamps, columns=columns)
+
+
+_REALTIME_MAX_TICKS = 10
+
+
+def _toggle_realtime() -> None:
+    """リアルタイムデモの開始/停止を切り替える"""
+    st.session_state.rt_running = not st.session_state.get('rt_running', False)
+    st.session_state.rt_tick = 0
+
+
+def _draw_realtime_chart(
+    charts: "BasicCharts",
+    data: pd.DataFrame,
+    chart_type: str,
+    stamp: str
+) -> None:
+    """リアルタイムデモのチャートを描画"""
+    if chart_type == "Line":
+        charts.line_chart(data, title=f"Real-time Line Chart - {stamp}")
+    elif chart_type == "Area":
+        charts.area_chart(data, title=f"Real-time Area Chart - {stamp}")
+    else:
+        # 最新の10データポイントを棒グラフで表示
+        # （NumPy上で転置し、DataFrameのコピーを1回に抑える）
+        recent = data.iloc[-10:]
+        bar_data = pd.DataFrame(
+            recent.to_numpy().T,
+            index=data.columns,
+            columns=recent.index.strftime('%H:%M:%S')
+        )
+        charts.bar_chart(bar_data, title=f"Real-time Bar Chart - {stamp}")
+
+
+def _render_realtime_frame(
+    charts: "BasicCharts",
+    generator: "ChartDataGenerator",
+    chart_type: str
+) -> None:
+    """
+    リアルタイムデモの1フレームを描画
+    
+    st.fragment(run_every=...)から呼ばれ、実行のたびに1回だけ更新する。
+    停止後は最後に描画したフレームをそのまま表示する
+    
+    Args:
+        charts: チャート描画用インスタンス
+        generator: データ生成用インスタンス
+        chart_type: "Line" / "Area" / "Bar"
+    """
+    if not st.session_state.get('rt_running', False):
+        if st.session_state.get('rt_tick', 0) >= _REALTIME_MAX_TICKS:
+            st.success("Real-time demo completed!")
+        last_frame = st.session_state.get('rt_last_frame')
+        if last_frame is not None:
+            data, stamp = last_frame
+            _draw_realtime_chart(charts, data, chart_type, stamp)
+        return
+    
+    try:
+        data = generator.generate_realtime_data(
+            columns=["Sensor1", "Sensor2", "Sensor3"],
+            points=50
+        )
+        stamp = datetime.now().strftime('%H:%M:%S')
+        _draw_realtime_chart(charts, data, chart_type, stamp)
+    except Exception as e:
+        st.session_state.rt_running = False
+        st.error(f"Error during real-time demo: {str(e)}")
+        st.info("Please try again.")
+        return
+    
+    st.session_state.rt_last_frame = (data, stamp)
+    st.session_state.rt_tick = st.session_state.get('rt_tick', 0) + 1
+    if st.session_state.rt_tick >= _REALTIME_MAX_TICKS:
+        # 規定回数に達したらアプリ全体を再実行して自動更新を止める
+        st.session_state.rt_running = False
+        st.rerun()
 
 
 def render_basic_charts_demo():
@@ -513,46 +594,20 @@ def render_basic_charts_demo():
             horizontal=True
         )
         
-        # データ生成とプロット
-        placeholder = st.empty()
+        running = st.session_state.get('rt_running', False)
+        st.button(
+            "Stop Real-time Demo" if running else "Start Real-time Demo",
+            type="primary",
+            key="rt_toggle",
+            on_click=_toggle_realtime
+        )
         
-        if st.button("Start Real-time Demo", type="primary"):
-            try:
-                for i in range(10):  # 10回更新
-                    data = generator.generate_realtime_data(
-                        columns=["Sensor1", "Sensor2", "Sensor3"],
-                        points=50
-                    )
-                    
-                    with placeholder.container():
-                        if chart_type == "Line":
-                            charts.line_chart(
-                                data,
-                                title=f"Real-time Line Chart - {datetime.now().strftime('%H:%M:%S')}"
-                            )
-                        elif chart_type == "Area":
-                            charts.area_chart(
-                                data,
-                                title=f"Real-time Area Chart - {datetime.now().strftime('%H:%M:%S')}"
-                            )
-                        else:
-                            # 最新の10データポイントを棒グラフで表示
-                            bar_data = data.tail(10).T
-                            charts.bar_chart(
-                                bar_data,
-                                title=f"Real-time Bar Chart - {datetime.now().strftime('%H:%M:%S')}"
-                            )
-                    
-                    # 最後の更新でない場合のみsleep
-                    if i < 9:
-                        import time
-                        time.sleep(update_interval)
-                
-                st.success("Real-time demo completed!")
-                
-            except Exception as e:
-                st.error(f"Error during real-time demo: {str(e)}")
-                st.info("Please try again.")
+        # 実行中はフラグメントだけを一定間隔で再実行し、スクリプト全体をブロックしない
+        realtime_frame = st.fragment(
+            _render_realtime_frame,
+            run_every=update_interval if running else None
+        )
+        realtime_frame(charts, generator, chart_type)
         
         # 統計情報の表示
         with st.expander("Data Statistics"):
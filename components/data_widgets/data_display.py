@@ -4,10 +4,9 @@ dataframe, table, metric, json の実装
 """
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import json
-from typing import Any, Dict, Optional, Union, List
+from functools import lru_cache
+from typing import Any, Dict, Optional, Union, List, Tuple, TYPE_CHECKING
+from types import MappingProxyType
 import sys
 from pathlib import Path
 
@@ -15,69 +14,375 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from components.base_component import BaseComponent
-from utils.code_display import code_display
-from utils.sample_data import sample_data
+from utils.code_display import code_display, compute_content_hash
+
+# pandas/numpy/sample_data は起動時間短縮のため使用時に遅延インポートする
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+
+@lru_cache(maxsize=1)
+def _rng() -> "np.random.Generator":
+    """デモデータ用の乱数生成器（PCG64）を初回使用時に生成"""
+    import numpy as np
+    return np.random.default_rng()
+
+
+# サンプルデータ生成（キャッシュは _dataframe_tables でまとめて行う）
+def _gen_basic(rows: int) -> "pd.DataFrame":
+    """基本的なサンプルDataFrameを生成"""
+    from utils.sample_data import sample_data
+    return sample_data.generate_dataframe(rows=rows)
+
+
+def _gen_numeric(rows: int) -> "pd.DataFrame":
+    """数値のみのDataFrameを生成"""
+    import numpy as np
+    import pandas as pd
+    # 表示用途なので float32 で十分（Arrow 変換後の転送量が半分になる）
+    return pd.DataFrame(
+        _rng().standard_normal((rows, 5), dtype=np.float32),
+        columns=[f'Col_{i}' for i in range(1, 6)]
+    )
+
+
+def _gen_mixed(rows: int) -> "pd.DataFrame":
+    """混合型のDataFrameを生成"""
+    import numpy as np
+    import pandas as pd
+    rng = _rng()
+    ids = np.arange(1, rows + 1, dtype=np.int32)
+    return pd.DataFrame({
+        'ID': ids,
+        'Name': np.char.add('User_', ids.astype(str)),
+        'Score': rng.integers(60, 100, rows, dtype=np.int8),
+        'Rate': rng.uniform(0.5, 1.5, rows).astype(np.float32),
+        'Active': rng.choice(np.array([True, False]), rows)
+    })
+
+
+def _gen_timeseries(rows: int) -> "pd.DataFrame":
+    """時系列のDataFrameを生成"""
+    from utils.sample_data import sample_data
+    return sample_data.generate_time_series(days=rows)
+
+
+_DATAFRAME_GENERATORS = {
+    "基本": _gen_basic,
+    "数値のみ": _gen_numeric,
+    "混合型": _gen_mixed,
+    "時系列": _gen_timeseries,
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _describe(df: "pd.DataFrame") -> "pd.DataFrame":
+    """基本統計量を計算（同じDataFrameならキャッシュを返す）"""
+    return df.describe()
+
+
+def _to_arrow(df: "pd.DataFrame") -> Union["pa.Table", "pd.DataFrame"]:
+    """DataFrameをArrowテーブルに変換（変換できない場合はそのまま返す）"""
+    import pyarrow as pa
+    try:
+        return pa.Table.from_pandas(df)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # 型が混在した列（日付列を含むdescribe結果など）はst.dataframe側の変換に任せる
+        return df
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _dataframe_tables(
+    cols_type: str,
+    rows: int
+) -> Tuple["pd.DataFrame", Union["pa.Table", "pd.DataFrame"], Union["pa.Table", "pd.DataFrame"]]:
+    """
+    生成データと、そのArrowテーブル・基本統計量のArrowテーブルをまとめて保持
+    
+    st.dataframeはpandasのDataFrameを毎回Arrowに変換するため、変換済みの
+    テーブルを渡して再実行時の変換を省く。元のDataFrameも同じエントリに
+    入れることで、片方だけが破棄されて別の乱数データを指すことを防ぐ。
+    インスタンスは共有されるため呼び出し側で変更しないこと
+    """
+    df = _DATAFRAME_GENERATORS[cols_type](rows)
+    return df, _to_arrow(df), _to_arrow(_describe(df))
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _extreme_styles(df: "pd.DataFrame") -> "np.ndarray":
+    """
+    数値列の最大値・最小値セル用のCSS配列を一括で計算
+    
+    Styler.highlight_max/minのように列ごと・セルごとにスタイルを組み立てず、
+    NumPyで全セル分のCSSをまとめて作成する
+    """
+    import numpy as np
+    numeric = df.select_dtypes(include='number')
+    is_max = numeric.eq(numeric.max()).to_numpy()
+    is_min = numeric.eq(numeric.min()).to_numpy()
+    
+    styles = np.full(df.shape, '', dtype=object)
+    styles[:, df.columns.get_indexer(numeric.columns)] = np.where(
+        is_min, 'background-color: lightcoral',
+        np.where(is_max, 'background-color: lightgreen', '')
+    )
+    return styles
+
+
+@lru_cache(maxsize=1)
+def _get_mixed_column_config() -> Dict[str, Any]:
+    """混合型データ用の列設定を生成（初回のみ構築して以降は使い回す）"""
+    return {
+        "ID": st.column_config.NumberColumn(
+            "ユーザーID",
+            help="一意の識別子",
+            format="%d"
+        ),
+        "Name": st.column_config.TextColumn(
+            "ユーザー名",
+            help="登録名",
+            max_chars=50
+        ),
+        "Score": st.column_config.ProgressColumn(
+            "スコア",
+            help="パフォーマンススコア",
+            format="%d",
+            min_value=0,
+            max_value=100
+        ),
+        "Rate": st.column_config.NumberColumn(
+            "レート",
+            help="成長率",
+            format="%.2f"
+        ),
+        "Active": st.column_config.CheckboxColumn(
+            "アクティブ",
+            help="アクティブ状態",
+            default=False
+        )
+    }
+
+
+@st.cache_data(show_spinner=False)
+def _table_simple() -> "pd.DataFrame":
+    """シンプルなテーブル用データを生成"""
+    import pandas as pd
+    return pd.DataFrame({
+        '項目': ['りんご', 'バナナ', 'オレンジ', 'ぶどう'],
+        '価格': [150, 100, 120, 300],
+        '在庫': [50, 100, 80, 30]
+    })
+
+
+@st.cache_data(show_spinner=False)
+def _table_stats() -> "pd.DataFrame":
+    """統計表用データを生成"""
+    import pandas as pd
+    return pd.DataFrame({
+        '指標': ['平均', '中央値', '最大値', '最小値', '標準偏差'],
+        'A列': [10.5, 10.0, 15.0, 5.0, 3.2],
+        'B列': [20.3, 19.5, 30.0, 10.0, 5.6],
+        'C列': [15.7, 15.0, 25.0, 8.0, 4.1]
+    })
+
+
+@st.cache_data(show_spinner=False)
+def _table_matrix() -> "pd.DataFrame":
+    """マトリックス用データを生成"""
+    import numpy as np
+    import pandas as pd
+    return pd.DataFrame(
+        _rng().integers(0, 100, size=(5, 5), dtype=np.int16),
+        columns=[f'Col{i}' for i in range(1, 6)],
+        index=[f'Row{i}' for i in range(1, 6)]
+    )
+
+
+_TABLE_GENERATORS = {
+    "シンプル": _table_simple,
+    "統計表": _table_stats,
+    "マトリックス": _table_matrix,
+}
+
+
+# 静的なサンプルJSON（インポート時に一度だけ構築し、全セッションで共有する）
+_SAMPLE_API = {
+    "status": "success",
+    "code": 200,
+    "data": {
+        "user": {
+            "id": 12345,
+            "name": "John Doe",
+            "email": "john@example.com",
+            "verified": True
+        },
+        "tokens": {
+            "access": "eyJhbGciOiJIUzI1NiIs...",
+            "refresh": "eyJhbGciOiJIUzI1NiIs...",
+            "expires_in": 3600
+        }
+    },
+    "timestamp": "2024-01-01T12:00:00Z"
+}
+
+_SAMPLE_CONFIG = {
+    "app": {
+        "name": "MyApp",
+        "version": "1.2.3",
+        "debug": False
+    },
+    "database": {
+        "host": "localhost",
+        "port": 5432,
+        "name": "mydb",
+        "pool_size": 10
+    },
+    "features": {
+        "authentication": True,
+        "notifications": True,
+        "analytics": False
+    }
+}
+
+def _build_array_sample(n: int) -> List[Dict[str, Any]]:
+    """配列サンプルを生成（要素ごとの f-string / 剰余計算を NumPy でまとめて行う）"""
+    import numpy as np
+    ids = np.arange(n)
+    values = np.char.add('item_', ids.astype(str))
+    active = (ids & 1) == 0
+    keys = ('id', 'value', 'active')
+    return [
+        dict(zip(keys, row))
+        for row in zip(ids.tolist(), values.tolist(), active.tolist())
+    ]
+
+
+# 要素数が固定（5件）のサンプルはリテラルとして保持する
+# （st.write はタプルを repr で表示するためリストのまま）
+_SAMPLE_ARRAY = [
+    {"id": 0, "value": "item_0", "active": True},
+    {"id": 1, "value": "item_1", "active": False},
+    {"id": 2, "value": "item_2", "active": True},
+    {"id": 3, "value": "item_3", "active": False},
+    {"id": 4, "value": "item_4", "active": True},
+]
+
+_SAMPLES = {
+    "API レスポンス": _SAMPLE_API,
+    "設定ファイル": _SAMPLE_CONFIG,
+    "配列": _SAMPLE_ARRAY,
+}
+
+
+@st.cache_data(show_spinner=False)
+def _json_nested() -> Dict[str, Any]:
+    """ネスト構造のJSONを生成"""
+    from utils.sample_data import sample_data
+    return sample_data.generate_json_data()
+
+
+def _json_sample(json_type: str) -> Any:
+    """選択されたタイプのサンプルJSONを取得"""
+    sample = _SAMPLES.get(json_type)
+    return sample if sample is not None else _json_nested()
+
+
+@st.cache_data(show_spinner=False)
+def _pretty_json(json_type: str) -> str:
+    """サンプルJSONを整形済み文字列に変換（タイプごとに1回だけシリアライズ）"""
+    data = _json_sample(json_type)
+    try:
+        import orjson
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    except (ImportError, TypeError):
+        # orjson 未インストール、または orjson で扱えない値を含む場合は標準ライブラリで整形
+        import json
+        return json.dumps(data, indent=2)
 
 
 class DataFrameComponent(BaseComponent):
     """st.dataframe コンポーネント"""
     
+    _METADATA = MappingProxyType({
+        'id': 'dataframe',
+        'name': 'st.dataframe',
+        'category': 'data_widgets',
+        'description': 'インタラクティブなデータフレーム表示。ソート、フィルタ、列の幅調整が可能。',
+        'parameters': [
+            {
+                'name': 'data',
+                'type': 'DataFrame/dict/list',
+                'required': True,
+                'description': '表示するデータ'
+            },
+            {
+                'name': 'use_container_width',
+                'type': 'bool',
+                'required': False,
+                'default': False,
+                'description': 'コンテナの幅に合わせる'
+            },
+            {
+                'name': 'hide_index',
+                'type': 'bool',
+                'required': False,
+                'default': None,
+                'description': 'インデックス列を非表示'
+            },
+            {
+                'name': 'column_order',
+                'type': 'list',
+                'required': False,
+                'default': None,
+                'description': '列の表示順序'
+            },
+            {
+                'name': 'column_config',
+                'type': 'dict',
+                'required': False,
+                'default': None,
+                'description': '列の設定（型、書式など）'
+            }
+        ],
+        'tips': [
+            'ユーザーがソート、フィルタ、検索可能',
+            '大量データでも高速表示',
+            'column_configで詳細なカスタマイズが可能',
+            'CSVダウンロード機能付き',
+            'セル選択とコピーが可能'
+        ],
+        'related': ['table', 'data_editor', 'columns'],
+        'version_added': '0.1.0'
+    })
+    
     def __init__(self):
         super().__init__("dataframe", "data_widgets")
-        self.metadata = {
-            'id': 'dataframe',
-            'name': 'st.dataframe',
-            'category': 'data_widgets',
-            'description': 'インタラクティブなデータフレーム表示。ソート、フィルタ、列の幅調整が可能。',
-            'parameters': [
-                {
-                    'name': 'data',
-                    'type': 'DataFrame/dict/list',
-                    'required': True,
-                    'description': '表示するデータ'
-                },
-                {
-                    'name': 'use_container_width',
-                    'type': 'bool',
-                    'required': False,
-                    'default': False,
-                    'description': 'コンテナの幅に合わせる'
-                },
-                {
-                    'name': 'hide_index',
-                    'type': 'bool',
-                    'required': False,
-                    'default': None,
-                    'description': 'インデックス列を非表示'
-                },
-                {
-                    'name': 'column_order',
-                    'type': 'list',
-                    'required': False,
-                    'default': None,
-                    'description': '列の表示順序'
-                },
-                {
-                    'name': 'column_config',
-                    'type': 'dict',
-                    'required': False,
-                    'default': None,
-                    'description': '列の設定（型、書式など）'
-                }
-            ],
-            'tips': [
-                'ユーザーがソート、フィルタ、検索可能',
-                '大量データでも高速表示',
-                'column_configで詳細なカスタマイズが可能',
-                'CSVダウンロード機能付き',
-                'セル選択とコピーが可能'
-            ],
-            'related': ['table', 'data_editor', 'columns'],
-            'version_added': '0.1.0'
-        }
+        self.metadata = self._METADATA
     
     def render_demo(self) -> Any:
         """デモをレンダリング"""
+        df = self._render_interactive()
+        
+        # コード表示
+        st.divider()
+        st.subheader("💻 生成されたコード")
+        code = self.get_code("basic")
+        code_display.display_with_copy(
+            code,
+            key="dataframe_demo_code",
+            content_hash=self._CODE_BASIC_HASH
+        )
+        
+        return df
+    
+    @st.fragment
+    def _render_interactive(self) -> Any:
+        """パラメータ設定から統計情報までを描画
+        
+        フラグメントとして実行するため、パラメータ変更時はこの範囲だけが再実行される
+        """
         with st.expander("⚙️ パラメータ設定", expanded=True):
             col1, col2, col3 = st.columns(3)
             
@@ -113,64 +418,21 @@ class DataFrameComponent(BaseComponent):
                     key="df_config"
                 )
         
-        # サンプルデータ生成
-        if cols_type == "基本":
-            df = sample_data.generate_dataframe(rows=rows)
-        elif cols_type == "数値のみ":
-            df = pd.DataFrame(
-                np.random.randn(rows, 5),
-                columns=[f'Col_{i}' for i in range(1, 6)]
-            )
-        elif cols_type == "混合型":
-            df = pd.DataFrame({
-                'ID': range(1, rows + 1),
-                'Name': [f'User_{i}' for i in range(1, rows + 1)],
-                'Score': np.random.randint(60, 100, rows),
-                'Rate': np.random.uniform(0.5, 1.5, rows),
-                'Active': np.random.choice([True, False], rows)
-            })
-        else:  # 時系列
-            df = sample_data.generate_time_series(days=rows)
+        # サンプルデータ生成（行数・列タイプが同じならキャッシュを利用）
+        df, df_table, describe_table = _dataframe_tables(cols_type, rows)
         
         # ハイライト設定
         if highlight and cols_type in ["数値のみ", "混合型"]:
-            df_styled = df.style.highlight_max(axis=0, color='lightgreen')
-            df_styled = df_styled.highlight_min(axis=0, color='lightcoral')
+            styles = _extreme_styles(df)
+            df_styled = df.style.apply(lambda _: styles, axis=None)
         else:
-            df_styled = df
+            df_styled = None
         
         # 列設定
-        column_config = None
-        if show_config and cols_type == "混合型":
-            column_config = {
-                "ID": st.column_config.NumberColumn(
-                    "ユーザーID",
-                    help="一意の識別子",
-                    format="%d"
-                ),
-                "Name": st.column_config.TextColumn(
-                    "ユーザー名",
-                    help="登録名",
-                    max_chars=50
-                ),
-                "Score": st.column_config.ProgressColumn(
-                    "スコア",
-                    help="パフォーマンススコア",
-                    format="%d",
-                    min_value=0,
-                    max_value=100
-                ),
-                "Rate": st.column_config.NumberColumn(
-                    "レート",
-                    help="成長率",
-                    format="%.2f"
-                ),
-                "Active": st.column_config.CheckboxColumn(
-                    "アクティブ",
-                    help="アクティブ状態",
-                    default=False
-                )
-            }
+        column_config = (
+            _get_mixed_column_config()
+            if show_config and cols_type == "混合型" else None
+        )
         
         # デモ実行
         st.divider()
@@ -178,7 +440,7 @@ class DataFrameComponent(BaseComponent):
         
         # DataFrameの表示
         st.dataframe(
-            df_styled,
+            df_styled if df_styled is not None else df_table,
             use_container_width=use_container,
             hide_index=hide_index,
             column_config=column_config
@@ -187,28 +449,21 @@ class DataFrameComponent(BaseComponent):
         # 統計情報
         with st.expander("📊 データ統計"):
             col1, col2, col3 = st.columns(3)
+            n_rows, n_cols = df.shape
             with col1:
-                st.metric("行数", len(df))
+                st.metric("行数", n_rows)
             with col2:
-                st.metric("列数", len(df.columns))
+                st.metric("列数", n_cols)
             with col3:
-                st.metric("データ型", len(df.dtypes.unique()))
+                st.metric("データ型", df.dtypes.nunique())
             
             st.write("**基本統計:**")
-            st.dataframe(df.describe())
+            st.dataframe(describe_table)
         
-        # コード表示
-        st.divider()
-        st.subheader("💻 生成されたコード")
-        code = self.get_code("basic")
-        code_display.display_with_copy(code, key="dataframe_demo_code")
-        
-        return df
+        # キャッシュ上のインスタンスは共有されているため、呼び出し側にはコピーを返す
+        return df.copy()
     
-    def get_code(self, level: str = "basic") -> str:
-        """コードを取得"""
-        if level == "basic":
-            return """import streamlit as st
+    _CODE_BASIC = """import streamlit as st
 import pandas as pd
 
 # DataFrameの作成
@@ -226,9 +481,8 @@ st.dataframe(df, use_container_width=True)
 
 # インデックスを非表示
 st.dataframe(df, hide_index=True)"""
-        
-        elif level == "advanced":
-            return """import streamlit as st
+    
+    _CODE_ADVANCED = """import streamlit as st
 import pandas as pd
 import numpy as np
 
@@ -261,9 +515,8 @@ st.dataframe(
     },
     hide_index=True
 )"""
-        
-        else:  # full
-            return """import streamlit as st
+    
+    _CODE_FULL = """import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -384,14 +637,16 @@ def create_interactive_dataframe():
     
     # フィルタリング
     with st.expander("🔍 フィルタ設定"):
-        filter_cols = st.multiselect(
-            "表示する列",
-            options=df.columns.tolist(),
-            default=df.columns.tolist()
-        )
-        df_filtered = df[filter_cols] if filter_cols else df
-    else:
-        df_filtered = df
+        if st.checkbox("フィルタを有効化"):
+            all_cols = list(df.columns)
+            filter_cols = st.multiselect(
+                "表示する列",
+                options=all_cols,
+                default=all_cols
+            )
+            df_filtered = df[filter_cols] if filter_cols else df
+        else:
+            df_filtered = df
     
     # メイン表示
     st.dataframe(
@@ -447,39 +702,81 @@ def main():
 
 if __name__ == "__main__":
     main()"""
+    
+    _CODE_BASIC_HASH = compute_content_hash(_CODE_BASIC)
+    
+    def get_code(self, level: str = "basic") -> str:
+        """コードを取得"""
+        if level == "basic":
+            return self._CODE_BASIC
+        
+        elif level == "advanced":
+            return self._CODE_ADVANCED
+        
+        else:  # full
+            return self._CODE_FULL
 
 
 class TableComponent(BaseComponent):
     """st.table コンポーネント"""
     
+    _METADATA = MappingProxyType({
+        'id': 'table',
+        'name': 'st.table',
+        'category': 'data_widgets',
+        'description': '静的なテーブル表示。全データを一度に表示し、スクロール不可。',
+        'parameters': [
+            {
+                'name': 'data',
+                'type': 'DataFrame/dict/list',
+                'required': True,
+                'description': '表示するデータ'
+            }
+        ],
+        'tips': [
+            '小さなデータセット向け',
+            '全データが一度に表示される',
+            'インタラクティブ機能なし',
+            'プリント向けの表示',
+            'dataframeより軽量'
+        ],
+        'related': ['dataframe', 'data_editor', 'write'],
+        'version_added': '0.1.0'
+    })
+    
     def __init__(self):
         super().__init__("table", "data_widgets")
-        self.metadata = {
-            'id': 'table',
-            'name': 'st.table',
-            'category': 'data_widgets',
-            'description': '静的なテーブル表示。全データを一度に表示し、スクロール不可。',
-            'parameters': [
-                {
-                    'name': 'data',
-                    'type': 'DataFrame/dict/list',
-                    'required': True,
-                    'description': '表示するデータ'
-                }
-            ],
-            'tips': [
-                '小さなデータセット向け',
-                '全データが一度に表示される',
-                'インタラクティブ機能なし',
-                'プリント向けの表示',
-                'dataframeより軽量'
-            ],
-            'related': ['dataframe', 'data_editor', 'write'],
-            'version_added': '0.1.0'
-        }
+        self.metadata = self._METADATA
     
     def render_demo(self) -> Any:
         """デモをレンダリング"""
+        data = self._render_interactive()
+        
+        # 違いの説明
+        with st.expander("📖 table vs dataframe の違い"):
+            import pandas as pd
+            comparison = pd.DataFrame({
+                '機能': ['表示形式', 'ソート', '検索', 'スクロール', 'パフォーマンス', '用途'],
+                'st.table': ['静的', '不可', '不可', '不可', '軽量', '小規模データ'],
+                'st.dataframe': ['インタラクティブ', '可能', '可能', '可能', '大規模対応', '大規模データ']
+            })
+            st.table(comparison)
+        
+        # コード表示
+        st.divider()
+        st.subheader("💻 生成されたコード")
+        code = self.get_code("basic")
+        code_display.display_with_copy(
+            code,
+            key="table_demo_code",
+            content_hash=self._CODE_BASIC_HASH
+        )
+        
+        return data
+    
+    @st.fragment
+    def _render_interactive(self) -> Any:
+        """パラメータ設定と実行結果を描画（データタイプ変更時はこの範囲だけ再実行）"""
         with st.expander("⚙️ パラメータ設定", expanded=True):
             data_type = st.selectbox(
                 "データタイプ",
@@ -488,25 +785,7 @@ class TableComponent(BaseComponent):
             )
         
         # データ生成
-        if data_type == "シンプル":
-            data = pd.DataFrame({
-                '項目': ['りんご', 'バナナ', 'オレンジ', 'ぶどう'],
-                '価格': [150, 100, 120, 300],
-                '在庫': [50, 100, 80, 30]
-            })
-        elif data_type == "統計表":
-            data = pd.DataFrame({
-                '指標': ['平均', '中央値', '最大値', '最小値', '標準偏差'],
-                'A列': [10.5, 10.0, 15.0, 5.0, 3.2],
-                'B列': [20.3, 19.5, 30.0, 10.0, 5.6],
-                'C列': [15.7, 15.0, 25.0, 8.0, 4.1]
-            })
-        else:  # マトリックス
-            data = pd.DataFrame(
-                np.random.randint(0, 100, size=(5, 5)),
-                columns=[f'Col{i}' for i in range(1, 6)],
-                index=[f'Row{i}' for i in range(1, 6)]
-            )
+        data = _TABLE_GENERATORS[data_type]()
         
         # デモ実行
         st.divider()
@@ -518,27 +797,9 @@ class TableComponent(BaseComponent):
         st.write("**比較: st.dataframe() - インタラクティブ:**")
         st.dataframe(data)
         
-        # 違いの説明
-        with st.expander("📖 table vs dataframe の違い"):
-            comparison = pd.DataFrame({
-                '機能': ['表示形式', 'ソート', '検索', 'スクロール', 'パフォーマンス', '用途'],
-                'st.table': ['静的', '不可', '不可', '不可', '軽量', '小規模データ'],
-                'st.dataframe': ['インタラクティブ', '可能', '可能', '可能', '大規模対応', '大規模データ']
-            })
-            st.table(comparison)
-        
-        # コード表示
-        st.divider()
-        st.subheader("💻 生成されたコード")
-        code = self.get_code("basic")
-        code_display.display_with_copy(code, key="table_demo_code")
-        
         return data
     
-    def get_code(self, level: str = "basic") -> str:
-        """コードを取得"""
-        if level == "basic":
-            return """import streamlit as st
+    _CODE_BASIC = """import streamlit as st
 import pandas as pd
 
 # データの準備
@@ -550,8 +811,8 @@ data = pd.DataFrame({
 
 # 静的テーブルとして表示
 st.table(data)"""
-        else:
-            return """import streamlit as st
+    
+    _CODE_ADVANCED = """import streamlit as st
 import pandas as pd
 import numpy as np
 
@@ -573,56 +834,135 @@ corr_matrix = pd.DataFrame(
 
 st.write("### 🔗 相関行列")
 st.table(corr_matrix.round(2))"""
+    
+    _CODE_BASIC_HASH = compute_content_hash(_CODE_BASIC)
+    
+    def get_code(self, level: str = "basic") -> str:
+        """コードを取得"""
+        if level == "basic":
+            return self._CODE_BASIC
+        else:
+            return self._CODE_ADVANCED
+
+
+# メトリクスデモ（入力を持つカスタムのみフラグメント化）
+def _render_sales_metrics(show_delta: bool, delta_color: str) -> None:
+    """売上メトリクスのデモ"""
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric(
+            label="総売上",
+            value="¥2.5M",
+            delta="12%" if show_delta else None,
+            delta_color=delta_color
+        )
+    with col2:
+        st.metric(
+            label="注文数",
+            value="1,234",
+            delta="+89" if show_delta else None,
+            delta_color=delta_color
+        )
+    with col3:
+        st.metric(
+            label="平均単価",
+            value="¥2,028",
+            delta="-5%" if show_delta else None,
+            delta_color=delta_color
+        )
+    with col4:
+        st.metric(
+            label="コンバージョン率",
+            value="3.2%",
+            delta="+0.3%" if show_delta else None,
+            delta_color=delta_color
+        )
+
+
+def _render_user_metrics() -> None:
+    """ユーザーメトリクスのデモ"""
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("アクティブユーザー", "8,234", "+12.3%")
+    with col2:
+        st.metric("新規登録", "523", "+48")
+    with col3:
+        st.metric("継続率", "68%", "-2%", delta_color="inverse")
+
+
+def _render_performance_metrics() -> None:
+    """パフォーマンスメトリクスのデモ"""
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("CPU使用率", "45%", "+5%", delta_color="inverse")
+    with col2:
+        st.metric("メモリ", "2.3GB", "-0.2GB")
+    with col3:
+        st.metric("レスポンス", "120ms", "-30ms")
+    with col4:
+        st.metric("エラー率", "0.02%", "-0.01%")
+
+
+@st.fragment
+def _render_custom_metric(show_delta: bool, delta_color: str) -> None:
+    """カスタムメトリクスのデモ（入力変更時はこのフラグメントだけ再実行）"""
+    label = st.text_input("ラベル", "カスタムメトリクス")
+    value = st.text_input("値", "100")
+    delta = st.text_input("デルタ", "+10") if show_delta else None
+    
+    st.metric(label, value, delta, delta_color=delta_color)
 
 
 class MetricComponent(BaseComponent):
     """st.metric コンポーネント"""
     
+    _METADATA = MappingProxyType({
+        'id': 'metric',
+        'name': 'st.metric',
+        'category': 'data_widgets',
+        'description': 'KPIやメトリクスを大きく見やすく表示。変化量（デルタ）も表示可能。',
+        'parameters': [
+            {
+                'name': 'label',
+                'type': 'str',
+                'required': True,
+                'description': 'メトリクスのラベル'
+            },
+            {
+                'name': 'value',
+                'type': 'int/float/str',
+                'required': True,
+                'description': '表示する値'
+            },
+            {
+                'name': 'delta',
+                'type': 'int/float/str',
+                'required': False,
+                'default': None,
+                'description': '変化量'
+            },
+            {
+                'name': 'delta_color',
+                'type': 'str',
+                'required': False,
+                'default': 'normal',
+                'description': 'デルタの色設定'
+            }
+        ],
+        'tips': [
+            'KPIダッシュボード向け',
+            'deltaで前期比などを表示',
+            'delta_color="inverse"で色を反転',
+            '複数並べてダッシュボード作成',
+            'アニメーション効果付き'
+        ],
+        'related': ['columns', 'container', 'number_input'],
+        'version_added': '0.1.0'
+    })
+    
     def __init__(self):
         super().__init__("metric", "data_widgets")
-        self.metadata = {
-            'id': 'metric',
-            'name': 'st.metric',
-            'category': 'data_widgets',
-            'description': 'KPIやメトリクスを大きく見やすく表示。変化量（デルタ）も表示可能。',
-            'parameters': [
-                {
-                    'name': 'label',
-                    'type': 'str',
-                    'required': True,
-                    'description': 'メトリクスのラベル'
-                },
-                {
-                    'name': 'value',
-                    'type': 'int/float/str',
-                    'required': True,
-                    'description': '表示する値'
-                },
-                {
-                    'name': 'delta',
-                    'type': 'int/float/str',
-                    'required': False,
-                    'default': None,
-                    'description': '変化量'
-                },
-                {
-                    'name': 'delta_color',
-                    'type': 'str',
-                    'required': False,
-                    'default': 'normal',
-                    'description': 'デルタの色設定'
-                }
-            ],
-            'tips': [
-                'KPIダッシュボード向け',
-                'deltaで前期比などを表示',
-                'delta_color="inverse"で色を反転',
-                '複数並べてダッシュボード作成',
-                'アニメーション効果付き'
-            ],
-            'related': ['columns', 'container', 'number_input'],
-            'version_added': '0.1.0'
-        }
+        self.metadata = self._METADATA
     
     def render_demo(self) -> Any:
         """デモをレンダリング"""
@@ -658,62 +998,13 @@ class MetricComponent(BaseComponent):
         st.subheader("📺 実行結果")
         
         if demo_type == "売上":
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric(
-                    label="総売上",
-                    value="¥2.5M",
-                    delta="12%" if show_delta else None,
-                    delta_color=delta_color
-                )
-            with col2:
-                st.metric(
-                    label="注文数",
-                    value="1,234",
-                    delta="+89" if show_delta else None,
-                    delta_color=delta_color
-                )
-            with col3:
-                st.metric(
-                    label="平均単価",
-                    value="¥2,028",
-                    delta="-5%" if show_delta else None,
-                    delta_color=delta_color
-                )
-            with col4:
-                st.metric(
-                    label="コンバージョン率",
-                    value="3.2%",
-                    delta="+0.3%" if show_delta else None,
-                    delta_color=delta_color
-                )
-                
+            _render_sales_metrics(show_delta, delta_color)
         elif demo_type == "ユーザー":
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("アクティブユーザー", "8,234", "+12.3%")
-            with col2:
-                st.metric("新規登録", "523", "+48")
-            with col3:
-                st.metric("継続率", "68%", "-2%", delta_color="inverse")
-                
+            _render_user_metrics()
         elif demo_type == "パフォーマンス":
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("CPU使用率", "45%", "+5%", delta_color="inverse")
-            with col2:
-                st.metric("メモリ", "2.3GB", "-0.2GB")
-            with col3:
-                st.metric("レスポンス", "120ms", "-30ms")
-            with col4:
-                st.metric("エラー率", "0.02%", "-0.01%")
-                
+            _render_performance_metrics()
         else:  # カスタム
-            label = st.text_input("ラベル", "カスタムメトリクス")
-            value = st.text_input("値", "100")
-            delta = st.text_input("デルタ", "+10") if show_delta else None
-            
-            st.metric(label, value, delta, delta_color=delta_color)
+            _render_custom_metric(show_delta, delta_color)
         
         # 複雑な例
         with st.expander("🎯 高度な使用例"):
@@ -721,9 +1012,17 @@ class MetricComponent(BaseComponent):
             
             # ヘッダー
             st.markdown("### 📊 リアルタイムメトリクス")
+            st.button(
+                "🔄 Refresh",
+                key="metric_refresh",
+                on_click=lambda: st.session_state.pop('metrics_demo', None)
+            )
             
-            # メトリクスグリッド
-            metrics = sample_data.generate_metrics_data()
+            # メトリクスグリッド（更新ボタンが押されるまでセッション内で使い回す）
+            if 'metrics_demo' not in st.session_state:
+                from utils.sample_data import sample_data
+                st.session_state.metrics_demo = sample_data.generate_metrics_data()
+            metrics = st.session_state.metrics_demo
             cols = st.columns(len(metrics))
             
             for col, (key, data) in zip(cols, metrics.items()):
@@ -748,14 +1047,15 @@ class MetricComponent(BaseComponent):
         st.divider()
         st.subheader("💻 生成されたコード")
         code = self.get_code("basic")
-        code_display.display_with_copy(code, key="metric_demo_code")
+        code_display.display_with_copy(
+            code,
+            key="metric_demo_code",
+            content_hash=self._CODE_BASIC_HASH
+        )
         
         return None
     
-    def get_code(self, level: str = "basic") -> str:
-        """コードを取得"""
-        if level == "basic":
-            return """import streamlit as st
+    _CODE_BASIC = """import streamlit as st
 
 # 基本的なメトリクス
 st.metric(label="温度", value="25.5°C", delta="1.2°C")
@@ -774,9 +1074,8 @@ with col2:
     
 with col3:
     st.metric("評価", "4.8", "-0.1", delta_color="inverse")"""
-        
-        else:
-            return """import streamlit as st
+    
+    _CODE_ADVANCED = """import streamlit as st
 import random
 import time
 
@@ -869,43 +1168,100 @@ def create_kpi_dashboard():
 
 # 使用例
 create_kpi_dashboard()"""
+    
+    _CODE_BASIC_HASH = compute_content_hash(_CODE_BASIC)
+    
+    def get_code(self, level: str = "basic") -> str:
+        """コードを取得"""
+        if level == "basic":
+            return self._CODE_BASIC
+        else:
+            return self._CODE_ADVANCED
+
+
+@lru_cache(maxsize=None)
+def _load_snippet(name: str) -> str:
+    """_snippets/ 配下のコードサンプルを読み込む（初回のみファイルを読む）"""
+    from importlib import resources
+    path = resources.files(__package__).joinpath("_snippets").joinpath(name)
+    text = path.read_text(encoding="utf-8")
+    return sys.intern(text.rstrip("\n"))
+
+
+# 仮想スクロール JSON ビューア
+# 整形はブラウザ側で行い、表示範囲の行だけを DOM に描画する（外部ライブラリ不要）
+_VIRTUAL_JSON_HTML = """
+<style>
+  #viewer { height: __HEIGHT__px; overflow-y: auto; position: relative;
+            font-family: monospace; font-size: 13px; background: #f8f9fb;
+            border: 1px solid #e6e9ef; border-radius: 4px; }
+  #spacer { position: relative; }
+  .row { position: absolute; left: 0; right: 0; height: 20px; line-height: 20px;
+         padding-left: 8px; white-space: pre; }
+</style>
+<div id="viewer"><div id="spacer"></div></div>
+<script>
+  const ROW_HEIGHT = 20;
+  const lines = JSON.stringify(__DATA__, null, 2).split("\\n");
+  const viewer = document.getElementById("viewer");
+  const spacer = document.getElementById("spacer");
+  spacer.style.height = (lines.length * ROW_HEIGHT) + "px";
+  function render() {
+    const first = Math.max(0, Math.floor(viewer.scrollTop / ROW_HEIGHT) - 10);
+    const last = Math.min(lines.length, first + Math.ceil(viewer.clientHeight / ROW_HEIGHT) + 20);
+    const fragment = document.createDocumentFragment();
+    for (let i = first; i < last; i++) {
+      const row = document.createElement("div");
+      row.className = "row";
+      row.style.top = (i * ROW_HEIGHT) + "px";
+      row.textContent = lines[i];
+      fragment.appendChild(row);
+    }
+    spacer.replaceChildren(fragment);
+  }
+  viewer.addEventListener("scroll", () => requestAnimationFrame(render));
+  render();
+</script>
+"""
 
 
 class JsonComponent(BaseComponent):
     """st.json コンポーネント"""
     
+    _METADATA = MappingProxyType({
+        'id': 'json',
+        'name': 'st.json',
+        'category': 'data_widgets',
+        'description': 'JSON形式のデータを整形して表示。展開/折りたたみ可能なツリー表示。',
+        'parameters': [
+            {
+                'name': 'body',
+                'type': 'dict/str',
+                'required': True,
+                'description': '表示するJSONデータ'
+            },
+            {
+                'name': 'expanded',
+                'type': 'bool/int',
+                'required': False,
+                'default': True,
+                'description': '展開レベル'
+            }
+        ],
+        'tips': [
+            'ツリー形式で表示',
+            '展開/折りたたみ可能',
+            'シンタックスハイライト付き',
+            'APIレスポンスの表示に便利',
+            'ネストした構造も見やすく表示'
+        ],
+        'related': ['write', 'code', 'dataframe'],
+        'version_added': '0.1.0'
+    })
+    
     def __init__(self):
         super().__init__("json", "data_widgets")
-        self.metadata = {
-            'id': 'json',
-            'name': 'st.json',
-            'category': 'data_widgets',
-            'description': 'JSON形式のデータを整形して表示。展開/折りたたみ可能なツリー表示。',
-            'parameters': [
-                {
-                    'name': 'body',
-                    'type': 'dict/str',
-                    'required': True,
-                    'description': '表示するJSONデータ'
-                },
-                {
-                    'name': 'expanded',
-                    'type': 'bool/int',
-                    'required': False,
-                    'default': True,
-                    'description': '展開レベル'
-                }
-            ],
-            'tips': [
-                'ツリー形式で表示',
-                '展開/折りたたみ可能',
-                'シンタックスハイライト付き',
-                'APIレスポンスの表示に便利',
-                'ネストした構造も見やすく表示'
-            ],
-            'related': ['write', 'code', 'dataframe'],
-            'version_added': '0.1.0'
-        }
+        self.metadata = self._METADATA
     
     def render_demo(self) -> Any:
         """デモをレンダリング"""
@@ -920,88 +1276,58 @@ class JsonComponent(BaseComponent):
                 value=True,
                 key="json_expanded"
             )
+            virtualize = st.checkbox(
+                "仮想スクロール表示",
+                value=False,
+                help="表示範囲の行だけを描画するビューアを使用（大きなJSON向け）",
+                key="json_virtualize"
+            )
         
         # サンプルJSON生成
-        if json_type == "API レスポンス":
-            json_data = {
-                "status": "success",
-                "code": 200,
-                "data": {
-                    "user": {
-                        "id": 12345,
-                        "name": "John Doe",
-                        "email": "john@example.com",
-                        "verified": True
-                    },
-                    "tokens": {
-                        "access": "eyJhbGciOiJIUzI1NiIs...",
-                        "refresh": "eyJhbGciOiJIUzI1NiIs...",
-                        "expires_in": 3600
-                    }
-                },
-                "timestamp": "2024-01-01T12:00:00Z"
-            }
-        elif json_type == "設定ファイル":
-            json_data = {
-                "app": {
-                    "name": "MyApp",
-                    "version": "1.2.3",
-                    "debug": False
-                },
-                "database": {
-                    "host": "localhost",
-                    "port": 5432,
-                    "name": "mydb",
-                    "pool_size": 10
-                },
-                "features": {
-                    "authentication": True,
-                    "notifications": True,
-                    "analytics": False
-                }
-            }
-        elif json_type == "ネスト構造":
-            json_data = sample_data.generate_json_data()
-        else:  # 配列
-            json_data = [
-                {"id": i, "value": f"item_{i}", "active": i % 2 == 0}
-                for i in range(5)
-            ]
+        json_data = _json_sample(json_type)
         
         # デモ実行
         st.divider()
         st.subheader("📺 実行結果")
         
-        st.json(json_data, expanded=expanded)
+        if virtualize:
+            self.render_virtualized(json_data)
+        else:
+            st.json(json_data, expanded=expanded)
         
-        # 他の表示方法との比較
+        # 他の表示方法との比較（チェック時のみ、選択中の表示方法だけを描画）
         with st.expander("🔄 他の表示方法との比較"):
-            tab1, tab2, tab3 = st.tabs(["st.json", "st.write", "st.code"])
-            
-            with tab1:
-                st.write("**st.json() - 専用ビューア:**")
-                st.json(json_data)
-            
-            with tab2:
-                st.write("**st.write() - 汎用表示:**")
-                st.write(json_data)
-            
-            with tab3:
-                st.write("**st.code() - コード表示:**")
-                st.code(json.dumps(json_data, indent=2), language="json")
+            if st.checkbox("比較を表示", key="json_compare"):
+                view = st.radio(
+                    "表示方法",
+                    ["st.json", "st.write", "st.code"],
+                    horizontal=True,
+                    key="json_compare_view"
+                )
+                
+                if view == "st.json":
+                    st.write("**st.json() - 専用ビューア:**")
+                    st.json(json_data, expanded=1)
+                elif view == "st.write":
+                    st.write("**st.write() - 汎用表示:**")
+                    st.write(json_data)
+                else:
+                    st.write("**st.code() - コード表示:**")
+                    st.code(_pretty_json(json_type), language="json")
         
         # コード表示
         st.divider()
         st.subheader("💻 生成されたコード")
         code = self.get_code("basic")
-        code_display.display_with_copy(code, key="json_demo_code")
+        code_display.display_with_copy(
+            code,
+            key="json_demo_code",
+            content_hash=self._CODE_BASIC_HASH
+        )
         
         return json_data
     
-    def get_code(self, level: str = "basic") -> str:
-        """コードを取得"""
-        if level == "basic":
-            return """import streamlit as st
+    _CODE_BASIC = """import streamlit as st
 
 # JSONデータの表示
 data = {
@@ -1014,71 +1340,104 @@ data = {
 st.json(data)
 
 # 展開レベルの制御
-st.json(data, expanded=False)"""
-        else:
-            return """import streamlit as st
-import json
-import requests
+st.json(data, expanded=False)
 
-# APIレスポンスの表示
-def display_api_response():
-    st.header("API Response Viewer")
+# 指定した深さまでだけ展開（大きなJSONでも描画が軽い）
+st.json(data, expanded=2)"""
     
-    # 擬似的なAPIレスポンス
-    response = {
-        "meta": {
-            "request_id": "abc123",
-            "timestamp": "2024-01-01T12:00:00Z",
-            "version": "v1"
-        },
-        "data": {
-            "items": [
-                {
-                    "id": 1,
-                    "name": "Item 1",
-                    "attributes": {
-                        "color": "red",
-                        "size": "large"
-                    }
-                },
-                {
-                    "id": 2,
-                    "name": "Item 2",
-                    "attributes": {
-                        "color": "blue",
-                        "size": "medium"
-                    }
-                }
-            ],
-            "total": 2,
-            "page": 1
-        },
-        "errors": []
-    }
+    _CODE_BASIC_HASH = compute_content_hash(_CODE_BASIC)
     
-    # JSON表示
-    st.json(response)
+    # レベル → コード（"advanced"/"full" など表にないレベルは応用コードを返す）
+    # インターンして全呼び出しで同一オブジェクトを返す（比較がポインタ比較で済む）
+    # 応用コードは _snippets/json_advanced.py.txt から初回要求時に読み込む
+    _CODE_SNIPPETS = MappingProxyType({
+        "basic": sys.intern(_CODE_BASIC),
+    })
     
-    # JSONの一部を抽出
-    if st.checkbox("データ部分のみ表示"):
-        st.json(response["data"])
+    @staticmethod
+    def safe_json(obj: Any, max_items: int = 100, max_depth: int = 4) -> Any:
+        """
+        st.json に渡す前に大きなJSONを切り詰める
+        
+        深いネストでも Python の再帰上限に当たらないよう、スタックで走査する
+        
+        Args:
+            obj: 対象のJSONデータ
+            max_items: リストに残す要素数の上限（超過分は "…(N more)" にまとめる）
+            max_depth: 表示する深さの上限（これより深いオブジェクトは "…" に置き換える）
+        
+        Returns:
+            切り詰めたJSONデータのコピー
+        """
+        root = [None]
+        # (元の値, 格納先のコンテナ, 格納先のキー/インデックス, 深さ)
+        stack = [(obj, root, 0, 0)]
+        
+        while stack:
+            value, parent, key, depth = stack.pop()
+            
+            if isinstance(value, dict):
+                if depth >= max_depth:
+                    parent[key] = "…"
+                    continue
+                out = dict.fromkeys(value)  # キーの順序を保ったまま後から埋める
+                for k, v in value.items():
+                    stack.append((v, out, k, depth + 1))
+                parent[key] = out
+            
+            elif isinstance(value, (list, tuple)):
+                if depth >= max_depth:
+                    parent[key] = "…"
+                    continue
+                head = value[:max_items]
+                out = [None] * len(head)
+                for i, v in enumerate(head):
+                    stack.append((v, out, i, depth + 1))
+                if len(value) > max_items:
+                    out.append(f"…({len(value) - max_items} more)")
+                parent[key] = out
+            
+            else:
+                parent[key] = value
+        
+        return root[0]
     
-    # ダウンロード機能
-    json_str = json.dumps(response, indent=2)
-    st.download_button(
-        "JSONファイルをダウンロード",
-        json_str,
-        "response.json",
-        "application/json"
-    )
-
-display_api_response()"""
+    @staticmethod
+    def render_virtualized(data: Any, height: int = 400) -> None:
+        """
+        大きなJSONを仮想スクロールで表示
+        
+        st.json は全ノードを描画するため、巨大なレスポンスでは表示範囲の行だけを
+        描画するこちらのビューアを使う
+        
+        Args:
+            data: 表示するJSONデータ
+            height: ビューアの高さ（px）
+        """
+        import json
+        import streamlit.components.v1 as components
+        
+        # 1行の最小化JSONとして埋め込む（</script> で埋め込みが途切れないようにエスケープ）
+        payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        payload = payload.replace("</", "<\\/")
+        html = (
+            _VIRTUAL_JSON_HTML
+            .replace("__HEIGHT__", str(height))
+            .replace("__DATA__", payload)
+        )
+        components.html(html, height=height + 10)
+    
+    @staticmethod
+    def get_code(level: str = "basic") -> str:
+        """コードを取得"""
+        code = JsonComponent._CODE_SNIPPETS.get(level)
+        return code if code is not None else _load_snippet("json_advanced.py.txt")
 
 
 # コンポーネントのエクスポート
-__all__ = [
+__all__ = (
     'DataFrameComponent',
-    'TableComponent', 
+    'TableComponent',
     'MetricComponent',
-    'JsonComponent'
-]
\ No newline at end of file
+    'JsonComponent',
+)
\ No newline at end of file
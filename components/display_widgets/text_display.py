@@ -4,55 +4,183 @@ write, markdown, title, header, subheader, caption, code, text, latex, divider 
 """
 
 import streamlit as st
-from typing import Any, Dict, Optional, Union
-import sys
-from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple, Union, TYPE_CHECKING
+from types import MappingProxyType
+from enum import IntEnum
 import json
 
-# プロジェクトルートをパスに追加
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from ..base_component import BaseComponent
+from utils.code_display import code_display, compute_content_hash
 
-from components.base_component import BaseComponent
-from utils.code_display import code_display
-from utils.sample_data import sample_data
+if TYPE_CHECKING:
+    import pandas as pd
 
 
-class WriteComponent(BaseComponent):
-    """st.write コンポーネント"""
+# サンプルデータ生成（同じ引数での再実行時はキャッシュを返す）
+@st.cache_data(show_spinner=False, max_entries=16)
+def _sample_dataframe(rows: int) -> "pd.DataFrame":
+    """サンプルDataFrameを生成"""
+    from utils.sample_data import sample_data
+    return sample_data.generate_dataframe(rows=rows)
+
+
+@st.cache_data(show_spinner=False)
+def _sample_json() -> Dict[str, Any]:
+    """サンプルJSONを生成"""
+    from utils.sample_data import sample_data
+    return sample_data.generate_json_data()
+
+
+class TextDisplayComponent(BaseComponent):
+    """
+    テキスト表示コンポーネントの共通基底クラス
+    
+    サブクラスはコンポーネントID・メタデータ・コード表をクラス属性として宣言し、
+    render_demo だけを実装する
+    """
+    
+    _COMPONENT_ID: str = ""
+    _METADATA: Mapping[str, Any] = MappingProxyType({})
+    _CODE_TABLE: Mapping[str, str] = MappingProxyType({})
+    _CODE_HASHES: Mapping[str, str] = MappingProxyType({})
+    # render_demo で使うウィジェットキー名（"{id}_{name}" を __init__ で一度だけ組み立てる）
+    _WIDGET_KEYS: Tuple[str, ...] = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # コードのハッシュはクラス定義時に一度だけ計算し、全インスタンスで共有する
+        cls._CODE_HASHES = MappingProxyType({
+            level: compute_content_hash(code)
+            for level, code in cls._CODE_TABLE.items()
+        })
     
     def __init__(self):
-        super().__init__("write", "display_widgets")
-        self.metadata = {
-            'id': 'write',
-            'name': 'st.write',
-            'category': 'display_widgets',
-            'description': '万能表示関数。テキスト、データフレーム、グラフ、Markdownなど様々な形式を自動判別して表示。',
-            'parameters': [
-                {
-                    'name': '*args',
-                    'type': 'Any',
-                    'required': True,
-                    'default': None,
-                    'description': '表示する内容（複数可）'
-                },
-                {
-                    'name': 'unsafe_allow_html',
-                    'type': 'bool',
-                    'required': False,
-                    'default': False,
-                    'description': 'HTMLの表示を許可'
-                }
-            ],
-            'tips': [
-                '最も汎用的な表示関数',
-                '複数の引数を渡すと順番に表示',
-                'DataFrameやチャートも自動で適切に表示',
-                'Markdown記法も自動認識',
-                'デバッグ時の変数確認に便利'
-            ],
-            'related': ['markdown', 'text', 'dataframe', 'json'],
-            'version_added': '0.1.0'
-        }
+        super().__init__(self._COMPONENT_ID, "display_widgets")
+        self.metadata = self._METADATA
+        self._keys.update({name: f"{self.id}_{name}" for name in self._WIDGET_KEYS})
+    
+    def get_code(self, level: str = "basic", params: Optional[Dict] = None) -> str:
+        """コードを取得（未定義のレベルはフルコードを返す）"""
+        return self._CODE_TABLE.get(level, self._CODE_TABLE["full"])
+    
+    @st.fragment
+    def _render_code_panel(self, key: str, level: str = "basic") -> None:
+        """生成されたコードを折りたたみ表示（フラグメントとして他の操作から切り離す）"""
+        with st.expander("💻 生成されたコード", expanded=False):
+            code_display.display_with_copy(
+                self.get_code(level),
+                key=key,
+                content_hash=self._CODE_HASHES[level]
+            )
+
+
+# st.write の様々な型の表示例（1回の st.markdown で送れるよう表にまとめておく）
+_TYPE_EXAMPLES_MARKDOWN = """
+| 型 | 表示例 |
+|----|--------|
+| 文字列 | Hello, World! |
+| 数値 | `42` `3.14159` |
+| リスト | `[1, 2, 3, 4, 5]` |
+| 辞書 | `{'name': 'Alice', 'age': 30}` |
+| ブール値 | `True` `False` |
+| None | `None` |
+| タプル | `(1, 'two', 3.0)` |
+| Markdown | **太字** *イタリック* `コード` |
+"""
+
+
+@st.fragment
+def _render_type_examples() -> None:
+    """st.write の様々な型の表示例（入力に依存しない静的な内容）"""
+    with st.expander("🎯 様々な型の表示例"):
+        st.markdown(_TYPE_EXAMPLES_MARKDOWN)
+
+
+class ContentType(IntEnum):
+    """st.write デモのコンテンツタイプ（値はハンドラー表・表示ラベルのインデックス）"""
+    TEXT = 0
+    MARKDOWN = 1
+    DATAFRAME = 2
+    JSON = 3
+    MULTIPLE = 4
+
+
+_CONTENT_LABELS = ("テキスト", "Markdown", "データフレーム", "辞書/JSON", "複数要素")
+_CONTENT_TYPES = tuple(ContentType)
+
+
+class WriteComponent(TextDisplayComponent):
+    """st.write コンポーネント"""
+    
+    _COMPONENT_ID = "write"
+    _WIDGET_KEYS = ("content_type", "text", "markdown", "rows", "html", "demo_code")
+    
+    _METADATA = MappingProxyType({
+        'id': 'write',
+        'name': 'st.write',
+        'category': 'display_widgets',
+        'description': '万能表示関数。テキスト、データフレーム、グラフ、Markdownなど様々な形式を自動判別して表示。',
+        'parameters': [
+            {
+                'name': '*args',
+                'type': 'Any',
+                'required': True,
+                'default': None,
+                'description': '表示する内容（複数可）'
+            },
+            {
+                'name': 'unsafe_allow_html',
+                'type': 'bool',
+                'required': False,
+                'default': False,
+                'description': 'HTMLの表示を許可'
+            }
+        ],
+        'tips': [
+            '最も汎用的な表示関数',
+            '複数の引数を渡すと順番に表示',
+            'DataFrameやチャートも自動で適切に表示',
+            'Markdown記法も自動認識',
+            'デバッグ時の変数確認に便利'
+        ],
+        'related': ['markdown', 'text', 'dataframe', 'json'],
+        'version_added': '0.1.0'
+    })
+    
+    # コンテンツタイプ別の入力処理（戻り値が表示内容になる）
+    def _input_text(self) -> Any:
+        """テキストを入力"""
+        return st.text_area(
+            "表示内容",
+            value="これはst.writeで表示されたテキストです。",
+            key=self._keys["text"]
+        )
+    
+    def _input_markdown(self) -> Any:
+        """Markdownを入力"""
+        return st.text_area(
+            "Markdown内容",
+            value="# 見出し\n**太字** と *イタリック*\n- リスト項目1\n- リスト項目2",
+            key=self._keys["markdown"]
+        )
+    
+    def _input_dataframe(self) -> Any:
+        """行数を指定してサンプルDataFrameを生成"""
+        rows = st.slider("行数", 3, 10, 5, key=self._keys["rows"])
+        return _sample_dataframe(rows)
+    
+    def _input_json(self) -> Any:
+        """サンプルJSONを生成"""
+        return _sample_json()
+    
+    def _input_multiple(self) -> Any:
+        """複数要素（表示内容は render_demo 側で組み立てる）"""
+        return None
+    
+    # ContentType の値の順に並べる
+    _CONTENT_HANDLERS = (
+        _input_text, _input_markdown, _input_dataframe, _input_json, _input_multiple
+    )
     
     def render_demo(self) -> Any:
         """デモをレンダリング"""
@@ -62,88 +190,55 @@ class WriteComponent(BaseComponent):
             with col1:
                 content_type = st.selectbox(
                     "コンテンツタイプ",
-                    ["テキスト", "Markdown", "データフレーム", "辞書/JSON", "複数要素"],
-                    key=f"{self.id}_content_type"
+                    _CONTENT_TYPES,
+                    format_func=_CONTENT_LABELS.__getitem__,
+                    key=self._keys["content_type"]
                 )
                 
-                if content_type == "テキスト":
-                    text_content = st.text_area(
-                        "表示内容",
-                        value="これはst.writeで表示されたテキストです。",
-                        key=f"{self.id}_text"
-                    )
-                    content = text_content
-                elif content_type == "Markdown":
-                    md_content = st.text_area(
-                        "Markdown内容",
-                        value="# 見出し\n**太字** と *イタリック*\n- リスト項目1\n- リスト項目2",
-                        key=f"{self.id}_markdown"
-                    )
-                    content = md_content
-                elif content_type == "データフレーム":
-                    rows = st.slider("行数", 3, 10, 5, key=f"{self.id}_rows")
-                    content = sample_data.generate_dataframe(rows=rows)
-                elif content_type == "辞書/JSON":
-                    content = sample_data.generate_json_data()
-                else:  # 複数要素
-                    content = None
+                content = self._CONTENT_HANDLERS[content_type](self)
             
             with col2:
                 unsafe_allow_html = st.checkbox(
                     "HTMLを許可",
                     value=False,
                     help="HTMLタグの表示を許可（セキュリティ注意）",
-                    key=f"{self.id}_html"
+                    key=self._keys["html"]
                 )
                 
                 if unsafe_allow_html:
                     st.warning("⚠️ HTMLを許可すると、悪意のあるコードが実行される可能性があります")
         
+        # 表示分岐の判定は一度だけ行う
+        is_multiple = content_type is ContentType.MULTIPLE
+        is_html_text = unsafe_allow_html and content_type is ContentType.TEXT
+        
         # デモ実行
         st.divider()
         st.subheader("📺 実行結果")
         
-        if content_type == "複数要素":
+        if is_multiple:
             st.write(
                 "文字列",
                 123,
                 {"key": "value"},
-                sample_data.generate_dataframe(rows=3)
+                _sample_dataframe(3)
             )
-        elif unsafe_allow_html and content_type == "テキスト":
+        elif is_html_text:
             html_content = '<p style="color: blue;">これは<strong>HTML</strong>です</p>'
             st.write(html_content, unsafe_allow_html=True)
         else:
             st.write(content)
         
         # 様々な型の表示例
-        with st.expander("🎯 様々な型の表示例"):
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.write("**文字列:**", "Hello, World!")
-                st.write("**数値:**", 42, 3.14159)
-                st.write("**リスト:**", [1, 2, 3, 4, 5])
-                st.write("**辞書:**", {"name": "Alice", "age": 30})
-            
-            with col2:
-                st.write("**ブール値:**", True, False)
-                st.write("**None:**", None)
-                st.write("**タプル:**", (1, "two", 3.0))
-                st.write("**Markdown:**", "**太字** *イタリック* `コード`")
+        _render_type_examples()
         
         # コード表示
         st.divider()
-        st.subheader("💻 生成されたコード")
-        code = self.get_code("basic")
-        code_display.display_with_copy(code, key=f"{self.id}_demo_code")
+        self._render_code_panel(self._keys["demo_code"])
         
         return None
     
-    def get_code(self, level: str = "basic", params: Optional[Dict] = None) -> str:
-        """コードを取得"""
-        if level == "basic":
-            return """import streamlit as st
+    _CODE_BASIC = """import streamlit as st
 
 # テキスト表示
 st.write("Hello, Streamlit!")
@@ -158,9 +253,8 @@ st.write("# 見出し\\n**太字** と *イタリック*")
 import pandas as pd
 df = pd.DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6]})
 st.write(df)"""
-        
-        elif level == "advanced":
-            return """import streamlit as st
+    
+    _CODE_ADVANCED = """import streamlit as st
 import pandas as pd
 import numpy as np
 
@@ -185,9 +279,8 @@ if df['A'].mean() > 0:
     st.write("✅ カラムAの平均は正の値です")
 else:
     st.write("❌ カラムAの平均は負の値です")"""
-        
-        else:  # full
-            return """import streamlit as st
+    
+    _CODE_FULL = """import streamlit as st
 import pandas as pd
 import numpy as np
 import json
@@ -253,51 +346,16 @@ def main():
 
 if __name__ == "__main__":
     main()"""
+    
+    _CODE_TABLE = MappingProxyType({
+        "basic": _CODE_BASIC,
+        "advanced": _CODE_ADVANCED,
+        "full": _CODE_FULL,
+    })
 
 
-class MarkdownComponent(BaseComponent):
-    """st.markdown コンポーネント"""
-    
-    def __init__(self):
-        super().__init__("markdown", "display_widgets")
-        self.metadata = {
-            'id': 'markdown',
-            'name': 'st.markdown',
-            'category': 'display_widgets',
-            'description': 'Markdown形式のテキストを表示。見出し、リスト、リンク、画像などをサポート。',
-            'parameters': [
-                {
-                    'name': 'body',
-                    'type': 'str',
-                    'required': True,
-                    'default': '',
-                    'description': 'Markdown形式のテキスト'
-                },
-                {
-                    'name': 'unsafe_allow_html',
-                    'type': 'bool',
-                    'required': False,
-                    'default': False,
-                    'description': 'HTMLタグの使用を許可'
-                }
-            ],
-            'tips': [
-                '見出し、太字、イタリック、リスト、リンクなどMarkdown記法をサポート',
-                'unsafe_allow_html=TrueでHTMLタグも使用可能',
-                'LaTeX数式も$$で囲むことで表示可能',
-                'コードブロックは```で囲む',
-                'カスタムCSSも適用可能'
-            ],
-            'related': ['write', 'text', 'latex', 'caption'],
-            'version_added': '0.1.0'
-        }
-    
-    def render_demo(self) -> Any:
-        """デモをレンダリング"""
-        with st.expander("⚙️ パラメータ設定", expanded=True):
-            markdown_text = st.text_area(
-                "Markdown内容",
-                value="""# Markdownデモ
+# st.markdown デモの初期表示内容
+_DEFAULT_MARKDOWN = """# Markdownデモ
 
 ## 基本的な書式
 
@@ -351,15 +409,74 @@ def hello():
 ブロック数式:
 $$
 \\frac{-b \\pm \\sqrt{b^2-4ac}}{2a}
-$$""",
+$$"""
+
+# HTML許可時の表示例
+_DEFAULT_HTML_MARKDOWN = """
+<div style="background-color: #f0f0f0; padding: 20px; border-radius: 10px;">
+    <h3 style="color: #FF4B4B;">カスタムスタイル</h3>
+    <p style="font-size: 18px;">HTMLタグとCSSを使用した<span style="color: blue;">カラフル</span>なテキスト</p>
+    <button style="background-color: #4CAF50; color: white; padding: 10px 20px; border: none; border-radius: 5px;">
+        ボタン（装飾のみ）
+    </button>
+</div>
+"""
+
+
+class MarkdownComponent(TextDisplayComponent):
+    """st.markdown コンポーネント"""
+    
+    _COMPONENT_ID = "markdown"
+    _WIDGET_KEYS = ("markdown", "html", "demo_code")
+    
+    _METADATA = MappingProxyType({
+        'id': 'markdown',
+        'name': 'st.markdown',
+        'category': 'display_widgets',
+        'description': 'Markdown形式のテキストを表示。見出し、リスト、リンク、画像などをサポート。',
+        'parameters': [
+            {
+                'name': 'body',
+                'type': 'str',
+                'required': True,
+                'default': '',
+                'description': 'Markdown形式のテキスト'
+            },
+            {
+                'name': 'unsafe_allow_html',
+                'type': 'bool',
+                'required': False,
+                'default': False,
+                'description': 'HTMLタグの使用を許可'
+            }
+        ],
+        'tips': [
+            '見出し、太字、イタリック、リスト、リンクなどMarkdown記法をサポート',
+            'unsafe_allow_html=TrueでHTMLタグも使用可能',
+            'LaTeX数式も$$で囲むことで表示可能',
+            'コードブロックは```で囲む',
+            'カスタムCSSも適用可能'
+        ],
+        'related': ['write', 'text', 'latex', 'caption'],
+        'version_added': '0.1.0'
+    })
+    
+    def render_demo(self) -> Any:
+        """デモをレンダリング"""
+        # 初期値はセッション状態に一度だけ設定し、value= で毎回送り直さない
+        st.session_state.setdefault(self._keys["markdown"], _DEFAULT_MARKDOWN)
+        
+        with st.expander("⚙️ パラメータ設定", expanded=True):
+            markdown_text = st.text_area(
+                "Markdown内容",
                 height=400,
-                key=f"{self.id}_markdown"
+                key=self._keys["markdown"]
             )
             
             unsafe_allow_html = st.checkbox(
                 "HTMLを許可",
                 value=False,
-                key=f"{self.id}_html"
+                key=self._keys["html"]
             )
         
         # デモ実行
@@ -372,29 +489,15 @@ $$""",
         if unsafe_allow_html:
             st.divider()
             st.subheader("🎯 HTML使用例")
-            html_markdown = """
-<div style="background-color: #f0f0f0; padding: 20px; border-radius: 10px;">
-    <h3 style="color: #FF4B4B;">カスタムスタイル</h3>
-    <p style="font-size: 18px;">HTMLタグとCSSを使用した<span style="color: blue;">カラフル</span>なテキスト</p>
-    <button style="background-color: #4CAF50; color: white; padding: 10px 20px; border: none; border-radius: 5px;">
-        ボタン（装飾のみ）
-    </button>
-</div>
-"""
-            st.markdown(html_markdown, unsafe_allow_html=True)
+            st.markdown(_DEFAULT_HTML_MARKDOWN, unsafe_allow_html=True)
         
         # コード表示
         st.divider()
-        st.subheader("💻 生成されたコード")
-        code = self.get_code("basic")
-        code_display.display_with_copy(code, key=f"{self.id}_demo_code")
+        self._render_code_panel(self._keys["demo_code"])
         
         return None
     
-    def get_code(self, level: str = "basic", params: Optional[Dict] = None) -> str:
-        """コードを取得"""
-        if level == "basic":
-            return """import streamlit as st
+    _CODE_BASIC = """import streamlit as st
 
 # Markdown表示
 st.markdown("# 見出し1")
@@ -407,9 +510,8 @@ st.markdown("[Streamlit](https://streamlit.io)")
 
 # 数式
 st.markdown("インライン数式: $E = mc^2$")"""
-        
-        elif level == "advanced":
-            return """import streamlit as st
+    
+    _CODE_ADVANCED = """import streamlit as st
 
 # カスタムスタイルのMarkdown
 st.markdown(\"\"\"
@@ -451,9 +553,8 @@ $$
 ROI = \\frac{利益 - 投資額}{投資額} \\times 100
 $$
 \"\"\")"""
-        
-        else:  # full
-            return """import streamlit as st
+    
+    _CODE_FULL = """import streamlit as st
 
 def create_report(title, data, metrics):
     \"\"\"Markdownレポートを生成\"\"\"
@@ -534,29 +635,35 @@ def main():
 
 if __name__ == "__main__":
     main()"""
+    
+    _CODE_TABLE = MappingProxyType({
+        "basic": _CODE_BASIC,
+        "advanced": _CODE_ADVANCED,
+        "full": _CODE_FULL,
+    })
 
 
-class HeadingComponents(BaseComponent):
+class HeadingComponents(TextDisplayComponent):
     """見出し系コンポーネント (title, header, subheader, caption)"""
     
-    def __init__(self):
-        super().__init__("headings", "display_widgets")
-        self.metadata = {
-            'id': 'headings',
-            'name': 'Heading Components',
-            'category': 'display_widgets',
-            'description': '見出し系コンポーネント。title, header, subheader, captionを含む。',
-            'components': ['st.title', 'st.header', 'st.subheader', 'st.caption'],
-            'tips': [
-                'title: 最も大きい見出し（ページタイトル用）',
-                'header: セクション見出し（H2相当）',
-                'subheader: サブセクション見出し（H3相当）',
-                'caption: 小さな説明文や注釈',
-                'anchor引数でアンカーリンクを設定可能'
-            ],
-            'related': ['markdown', 'text', 'write'],
-            'version_added': '0.1.0'
-        }
+    _COMPONENT_ID = "headings"
+    
+    _METADATA = MappingProxyType({
+        'id': 'headings',
+        'name': 'Heading Components',
+        'category': 'display_widgets',
+        'description': '見出し系コンポーネント。title, header, subheader, captionを含む。',
+        'components': ['st.title', 'st.header', 'st.subheader', 'st.caption'],
+        'tips': [
+            'title: 最も大きい見出し（ページタイトル用）',
+            'header: セクション見出し（H2相当）',
+            'subheader: サブセクション見出し（H3相当）',
+            'caption: 小さな説明文や注釈',
+            'anchor引数でアンカーリンクを設定可能'
+        ],
+        'related': ['markdown', 'text', 'write'],
+        'version_added': '0.1.0'
+    })
     
     def render_demo(self) -> Any:
         """デモをレンダリング"""
@@ -631,16 +738,11 @@ class HeadingComponents(BaseComponent):
         
         # コード表示
         st.divider()
-        st.subheader("💻 生成されたコード")
-        code = self.get_code("basic")
-        code_display.display_with_copy(code, key="heading_demo_code")
+        self._render_code_panel("heading_demo_code")
         
         return None
     
-    def get_code(self, level: str = "basic", params: Optional[Dict] = None) -> str:
-        """コードを取得"""
-        if level == "basic":
-            return """import streamlit as st
+    _CODE_BASIC = """import streamlit as st
 
 # 見出しの階層
 st.title("ページタイトル")
@@ -651,9 +753,8 @@ st.caption("小さな説明文や注釈")
 # アンカーリンク付き
 st.header("セクション1", anchor="section-1")
 st.subheader("サブセクション1.1", anchor="subsection-1-1")"""
-        
-        elif level == "advanced":
-            return """import streamlit as st
+    
+    _CODE_ADVANCED = """import streamlit as st
 
 # ページ構成の例
 st.title("📊 データ分析アプリケーション")
@@ -676,9 +777,8 @@ if uploaded_file:
     
     st.header("3. レポート出力")
     st.caption("分析結果のダウンロード")"""
-        
-        else:  # full
-            return """import streamlit as st
+    
+    _CODE_FULL = """import streamlit as st
 import pandas as pd
 
 def create_dashboard():
@@ -768,77 +868,26 @@ def main():
 
 if __name__ == "__main__":
     main()"""
+    
+    _CODE_TABLE = MappingProxyType({
+        "basic": _CODE_BASIC,
+        "advanced": _CODE_ADVANCED,
+        "full": _CODE_FULL,
+    })
 
 
-class CodeComponent(BaseComponent):
-    """st.code コンポーネント"""
-    
-    def __init__(self):
-        super().__init__("code", "display_widgets")
-        self.metadata = {
-            'id': 'code',
-            'name': 'st.code',
-            'category': 'display_widgets',
-            'description': 'シンタックスハイライト付きのコードブロック表示。プログラミング言語を自動認識。',
-            'parameters': [
-                {
-                    'name': 'body',
-                    'type': 'str',
-                    'required': True,
-                    'default': '',
-                    'description': '表示するコード'
-                },
-                {
-                    'name': 'language',
-                    'type': 'str',
-                    'required': False,
-                    'default': None,
-                    'description': 'プログラミング言語'
-                }
-            ],
-            'tips': [
-                '150以上の言語をサポート',
-                'language引数で言語を明示的に指定',
-                '自動的にコピーボタンが表示される',
-                '行番号は自動的に表示される',
-                'Markdownのコードブロックよりも高機能'
-            ],
-            'related': ['markdown', 'text', 'echo'],
-            'version_added': '0.1.0'
-        }
-    
-    def render_demo(self) -> Any:
-        """デモをレンダリング"""
-        with st.expander("⚙️ パラメータ設定", expanded=True):
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                language = st.selectbox(
-                    "プログラミング言語",
-                    ["python", "javascript", "java", "cpp", "go", "rust", 
-                     "sql", "html", "css", "bash", "yaml", "json"],
-                    key="code_language"
-                )
-            
-            with col2:
-                sample_type = st.radio(
-                    "サンプルタイプ",
-                    ["基本", "関数", "クラス"],
-                    key="code_sample"
-                )
-            
-            # 言語別サンプルコード
-            samples = {
-                "python": {
-                    "基本": "print('Hello, World!')\nx = 42\ny = x * 2",
-                    "関数": """def fibonacci(n):
+# st.code デモの言語別サンプルコード
+_CODE_SAMPLES = MappingProxyType({
+    "python": MappingProxyType({
+        "基本": "print('Hello, World!')\nx = 42\ny = x * 2",
+        "関数": """def fibonacci(n):
     if n <= 1:
         return n
     return fibonacci(n-1) + fibonacci(n-2)
 
 result = fibonacci(10)
 print(f"Fibonacci(10) = {result}")""",
-                    "クラス": """class Person:
+        "クラス": """class Person:
     def __init__(self, name, age):
         self.name = name
         self.age = age
@@ -848,17 +897,17 @@ print(f"Fibonacci(10) = {result}")""",
 
 person = Person("Alice", 30)
 print(person.greet())"""
-                },
-                "javascript": {
-                    "基本": "console.log('Hello, World!');\nconst x = 42;\nconst y = x * 2;",
-                    "関数": """function fibonacci(n) {
+    }),
+    "javascript": MappingProxyType({
+        "基本": "console.log('Hello, World!');\nconst x = 42;\nconst y = x * 2;",
+        "関数": """function fibonacci(n) {
     if (n <= 1) return n;
     return fibonacci(n - 1) + fibonacci(n - 2);
 }
 
 const result = fibonacci(10);
 console.log(`Fibonacci(10) = ${result}`);""",
-                    "クラス": """class Person {
+        "クラス": """class Person {
     constructor(name, age) {
         this.name = name;
         this.age = age;
@@ -871,14 +920,85 @@ console.log(`Fibonacci(10) = ${result}`);""",
 
 const person = new Person("Alice", 30);
 console.log(person.greet());"""
-                }
+    })
+})
+
+
+# 言語とサンプルタイプの選択肢
+_CODE_LANGUAGES = (
+    "python", "javascript", "java", "cpp", "go", "rust",
+    "sql", "html", "css", "bash", "yaml", "json"
+)
+_CODE_SAMPLE_TYPES = ("基本", "関数", "クラス")
+
+# 全組み合わせのデフォルトコード（サンプルがない組み合わせはプレースホルダー）
+_FULL_SAMPLE_TABLE = MappingProxyType({
+    (lang, sample_type): _CODE_SAMPLES.get(lang, {}).get(
+        sample_type,
+        f"// {lang} code example\n// Sample {sample_type}"
+    )
+    for lang in _CODE_LANGUAGES
+    for sample_type in _CODE_SAMPLE_TYPES
+})
+
+class CodeComponent(TextDisplayComponent):
+    """st.code コンポーネント"""
+    
+    _COMPONENT_ID = "code"
+    
+    _METADATA = MappingProxyType({
+        'id': 'code',
+        'name': 'st.code',
+        'category': 'display_widgets',
+        'description': 'シンタックスハイライト付きのコードブロック表示。プログラミング言語を自動認識。',
+        'parameters': [
+            {
+                'name': 'body',
+                'type': 'str',
+                'required': True,
+                'default': '',
+                'description': '表示するコード'
+            },
+            {
+                'name': 'language',
+                'type': 'str',
+                'required': False,
+                'default': None,
+                'description': 'プログラミング言語'
             }
+        ],
+        'tips': [
+            '150以上の言語をサポート',
+            'language引数で言語を明示的に指定',
+            '自動的にコピーボタンが表示される',
+            '行番号は自動的に表示される',
+            'Markdownのコードブロックよりも高機能'
+        ],
+        'related': ['markdown', 'text', 'echo'],
+        'version_added': '0.1.0'
+    })
+    
+    def render_demo(self) -> Any:
+        """デモをレンダリング"""
+        with st.expander("⚙️ パラメータ設定", expanded=True):
+            col1, col2 = st.columns(2)
             
-            # デフォルトコード
-            default_code = samples.get(language, {}).get(
-                sample_type,
-                f"// {language} code example\n// Sample {sample_type}"
-            )
+            with col1:
+                language = st.selectbox(
+                    "プログラミング言語",
+                    _CODE_LANGUAGES,
+                    key="code_language"
+                )
+            
+            with col2:
+                sample_type = st.radio(
+                    "サンプルタイプ",
+                    _CODE_SAMPLE_TYPES,
+                    key="code_sample"
+                )
+            
+            # デフォルトコード（言語 × サンプルタイプの事前計算済みテーブルから取得）
+            default_code = _FULL_SAMPLE_TABLE[language, sample_type]
             
             code_input = st.text_area(
                 "コード内容",
@@ -929,16 +1049,11 @@ jobs:
         
         # コード表示
         st.divider()
-        st.subheader("💻 生成されたコード")
-        code = self.get_code("basic")
-        code_display.display_with_copy(code, key="code_demo_code")
+        self._render_code_panel("code_demo_code")
         
         return None
     
-    def get_code(self, level: str = "basic", params: Optional[Dict] = None) -> str:
-        """コードを取得"""
-        if level == "basic":
-            return '''import streamlit as st
+    _CODE_BASIC = '''import streamlit as st
 
 # コード表示（言語自動検出）
 st.code("""
@@ -951,9 +1066,8 @@ st.code("""
 SELECT * FROM users
 WHERE age > 18
 """, language="sql")'''
-        
-        elif level == "advanced":
-            return '''import streamlit as st
+    
+    _CODE_ADVANCED = '''import streamlit as st
 
 # 動的なコード表示
 language = st.selectbox("言語選択", ["python", "javascript", "sql"])
@@ -988,9 +1102,8 @@ ORDER BY month DESC;
 }
 
 st.code(code_samples[language], language=language)'''
-        
-        else:  # full
-            return '''import streamlit as st
+    
+    _CODE_FULL = '''import streamlit as st
 
 def code_editor_demo():
     """コードエディタ風のデモ"""
@@ -1097,29 +1210,67 @@ def main():
 
 if __name__ == "__main__":
     main()'''
+    
+    _CODE_TABLE = MappingProxyType({
+        "basic": _CODE_BASIC,
+        "advanced": _CODE_ADVANCED,
+        "full": _CODE_FULL,
+    })
 
 
-class MessageComponents(BaseComponent):
+# メッセージのバリエーション例 (種類, 文言)
+_MESSAGE_VARIATIONS = (
+    ("success", "処理完了 ✅"),
+    ("success", "データを正常に保存しました"),
+    ("success", "🎉 おめでとうございます！目標を達成しました！"),
+    ("info", "💡 ヒント：Ctrl+Sで保存できます"),
+    ("info", "📢 新しいバージョンが利用可能です"),
+    ("info", "🔄 データを更新中..."),
+    ("warning", "⚠️ メモリ使用量が80%を超えています"),
+    ("warning", "🔋 バッテリー残量が少なくなっています"),
+    ("warning", "📊 一部のデータが欠損しています"),
+    ("error", "🚫 アクセスが拒否されました"),
+    ("error", "💔 接続が切断されました"),
+    ("error", "⏰ タイムアウトエラー"),
+)
+
+# 種類ごとの (背景色, 文字色)
+_ALERT_COLORS = MappingProxyType({
+    "success": ("#d4edda", "#155724"),
+    "info": ("#d1ecf1", "#0c5460"),
+    "warning": ("#fff3cd", "#856404"),
+    "error": ("#f8d7da", "#721c24"),
+})
+
+# バリエーション例を1回の st.markdown で送れるよう HTML にまとめておく
+_VARIATIONS_HTML = "\n".join(
+    f'<div style="background-color: {_ALERT_COLORS[kind][0]}; color: {_ALERT_COLORS[kind][1]}; '
+    f'padding: 0.75rem 1rem; border-radius: 0.5rem; margin-bottom: 0.5rem;">{message}</div>'
+    for kind, message in _MESSAGE_VARIATIONS
+)
+
+
+class MessageComponents(TextDisplayComponent):
     """メッセージ系コンポーネント (success, info, warning, error)"""
     
-    def __init__(self):
-        super().__init__("messages", "display_widgets")
-        self.metadata = {
-            'id': 'messages',
-            'name': 'Message Components',
-            'category': 'display_widgets',
-            'description': 'メッセージ表示コンポーネント。success, info, warning, errorの4種類。',
-            'components': ['st.success', 'st.info', 'st.warning', 'st.error'],
-            'tips': [
-                'success: 成功メッセージ（緑）',
-                'info: 情報メッセージ（青）',
-                'warning: 警告メッセージ（黄）',
-                'error: エラーメッセージ（赤）',
-                'アイコンは自動的に表示される'
-            ],
-            'related': ['balloons', 'snow', 'toast', 'exception'],
-            'version_added': '0.1.0'
-        }
+    _COMPONENT_ID = "messages"
+    
+    _METADATA = MappingProxyType({
+        'id': 'messages',
+        'name': 'Message Components',
+        'category': 'display_widgets',
+        'description': 'メッセージ表示コンポーネント。success, info, warning, errorの4種類。',
+        'components': ['st.success', 'st.info', 'st.warning', 'st.error'],
+        'tips': [
+            'success: 成功メッセージ（緑）',
+            'info: 情報メッセージ（青）',
+            'warning: 警告メッセージ（黄）',
+            'error: エラーメッセージ（赤）',
+            'アイコンは自動的に表示される'
+        ],
+        'related': ['balloons', 'snow', 'toast', 'exception'],
+        'version_added': '0.1.0'
+    })
     
     def render_demo(self) -> Any:
         """デモをレンダリング"""
@@ -1186,43 +1337,27 @@ class MessageComponents(BaseComponent):
         
         # バリエーション
         with st.expander("💡 メッセージのバリエーション"):
-            st.success("処理完了 ✅")
-            st.success("データを正常に保存しました")
-            st.success("🎉 おめでとうございます！目標を達成しました！")
-            
-            st.info("💡 ヒント：Ctrl+Sで保存できます")
-            st.info("📢 新しいバージョンが利用可能です")
-            st.info("🔄 データを更新中...")
-            
-            st.warning("⚠️ メモリ使用量が80%を超えています")
-            st.warning("🔋 バッテリー残量が少なくなっています")
-            st.warning("📊 一部のデータが欠損しています")
-            
-            st.error("🚫 アクセスが拒否されました")
-            st.error("💔 接続が切断されました")
-            st.error("⏰ タイムアウトエラー")
+            if st.checkbox("ネイティブのメッセージ要素で表示", key="msg_native_variations"):
+                for kind, message in _MESSAGE_VARIATIONS:
+                    getattr(st, kind)(message)
+            else:
+                st.markdown(_VARIATIONS_HTML, unsafe_allow_html=True)
         
         # コード表示
         st.divider()
-        st.subheader("💻 生成されたコード")
-        code = self.get_code("basic")
-        code_display.display_with_copy(code, key="messages_demo_code")
+        self._render_code_panel("messages_demo_code")
         
         return None
     
-    def get_code(self, level: str = "basic", params: Optional[Dict] = None) -> str:
-        """コードを取得"""
-        if level == "basic":
-            return """import streamlit as st
+    _CODE_BASIC = """import streamlit as st
 
 # メッセージの表示
 st.success("処理が正常に完了しました")
 st.info("新機能が追加されました")
 st.warning("データの一部が不完全です")
 st.error("ファイルが見つかりません")"""
-        
-        elif level == "advanced":
-            return """import streamlit as st
+    
+    _CODE_ADVANCED = """import streamlit as st
 
 # データ処理の状態表示
 def process_data(data):
@@ -1259,11 +1394,49 @@ with st.form("data_form"):
             st.warning("値が大きすぎる可能性があります")
         else:
             st.success("値が適切な範囲内です")"""
-        
-        else:  # full
-            return """import streamlit as st
+    
+    _CODE_FULL = """import streamlit as st
 import time
 import random
+import bisect
+
+# 成功率のしきい値と判定結果（bisect で if/elif を使わずに判定する）
+RATE_THRESHOLDS = (0.3, 0.8)
+RATE_STATUSES = ("error", "warning", "success")
+
+def show_success(progress_bar, status_text):
+    \"\"\"成功時の表示\"\"\"
+    progress_bar.progress(100)
+    status_text.text("完了！")
+    st.success("✅ ファイルの処理が正常に完了しました")
+    st.balloons()
+    
+    # 結果表示
+    with st.expander("処理結果"):
+        st.write("**処理されたレコード数**: 1,234")
+        st.write("**処理時間**: 2.3秒")
+        st.write("**エラー数**: 0")
+
+def show_partial(progress_bar, status_text):
+    \"\"\"部分的成功時の表示\"\"\"
+    progress_bar.progress(100)
+    st.warning("⚠️ 処理は完了しましたが、一部のデータにエラーがありました")
+    
+    with st.expander("詳細"):
+        st.write("**成功**: 1,200件")
+        st.write("**失敗**: 34件")
+        st.write("エラーの詳細はログファイルを確認してください")
+
+def show_error(progress_bar, status_text):
+    \"\"\"失敗時の表示\"\"\"
+    st.error("❌ 処理中にエラーが発生しました")
+    st.error("データ形式を確認してください")
+
+RESULT_HANDLERS = {
+    "success": show_success,
+    "warning": show_partial,
+    "error": show_error
+}
 
 def file_upload_handler():
     \"\"\"ファイルアップロードのハンドラー\"\"\"
@@ -1318,32 +1491,9 @@ def file_upload_handler():
                 # ランダムな結果シミュレーション
                 success_rate = random.random()
                 
-                if success_rate > 0.8:
-                    # 成功
-                    progress_bar.progress(100)
-                    status_text.text("完了！")
-                    st.success("✅ ファイルの処理が正常に完了しました")
-                    st.balloons()
-                    
-                    # 結果表示
-                    with st.expander("処理結果"):
-                        st.write("**処理されたレコード数**: 1,234")
-                        st.write("**処理時間**: 2.3秒")
-                        st.write("**エラー数**: 0")
-                    
-                elif success_rate > 0.3:
-                    # 部分的成功
-                    progress_bar.progress(100)
-                    st.warning("⚠️ 処理は完了しましたが、一部のデータにエラーがありました")
-                    
-                    with st.expander("詳細"):
-                        st.write("**成功**: 1,200件")
-                        st.write("**失敗**: 34件")
-                        st.write("エラーの詳細はログファイルを確認してください")
-                else:
-                    # 失敗
-                    st.error("❌ 処理中にエラーが発生しました")
-                    st.error("データ形式を確認してください")
+                # しきい値表から判定し、対応するハンドラーで結果を表示
+                status = RATE_STATUSES[bisect.bisect_left(RATE_THRESHOLDS, success_rate)]
+                RESULT_HANDLERS[status](progress_bar, status_text)
                     
             except Exception as e:
                 st.error(f"❌ 予期しないエラー: {str(e)}")
@@ -1383,6 +1533,12 @@ def main():
 
 if __name__ == "__main__":
     main()"""
+    
+    _CODE_TABLE = MappingProxyType({
+        "basic": _CODE_BASIC,
+        "advanced": _CODE_ADVANCED,
+        "full": _CODE_FULL,
+    })
 
 
 # コンポーネントのエクスポート
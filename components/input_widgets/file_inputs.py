@@ -5,26 +5,24 @@ file_uploader, camera_input, color_picker の実装
 
 import streamlit as st
 from typing import Any, Dict, Optional
-import sys
-from pathlib import Path
+from types import MappingProxyType
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from components.base_component import BaseComponent
-from utils.code_display import code_display
+from ..base_component import BaseComponent
 
 
 class FileUploaderComponent(BaseComponent):
     """st.file_uploader コンポーネント"""
     
+    _METADATA = MappingProxyType({
+        'id': 'file_uploader',
+        'name': 'st.file_uploader',
+        'category': 'input_widgets',
+        'description': 'ファイルアップロードウィジェット',
+    })
+    
     def __init__(self):
         super().__init__("file_uploader", "input_widgets")
-        self.metadata = {
-            'id': 'file_uploader',
-            'name': 'st.file_uploader',
-            'category': 'input_widgets',
-            'description': 'ファイルアップロードウィジェット',
-        }
+        self.metadata = self._METADATA
     
     def render_demo(self) -> Any:
         st.info("🚧 実装準備中")
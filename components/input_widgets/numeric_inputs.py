@@ -4,117 +4,278 @@ number_input の実装
 """
 
 import streamlit as st
-from typing import Any, Dict, Optional, Union
-import sys
-from pathlib import Path
+import string
+from typing import Any, Dict, Optional, Tuple, Union
+from types import MappingProxyType
 
-# プロジェクトルートをパスに追加
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from ..base_component import BaseComponent
 
-from components.base_component import BaseComponent
-from utils.code_display import code_display
-from utils.sample_data import sample_data
+
+# advanced / full コードのテンプレート（import 時に一度だけ組み立て、呼び出し時は置換のみ）
+_ADVANCED_TPL = string.Template("""import streamlit as st
+
+# 数値入力と計算
+number = st.number_input(
+    $params
+)
+
+# 計算結果
+col1, col2, col3 = st.columns(3)
+with col1:
+    st.metric("2倍", number * 2)
+with col2:
+    st.metric("平方", number ** 2)
+with col3:
+    st.metric("平方根", number ** 0.5 if number >= 0 else "N/A")
+
+# 範囲チェック
+if number < $min_value:
+    st.error("値が小さすぎます")
+elif number > $max_value:
+    st.error("値が大きすぎます")
+else:
+    st.success(f"有効な値: {number}")""")
+
+_FULL_TPL = string.Template("""import streamlit as st
+import pandas as pd
+import numpy as np
+
+def calculate_statistics(value: float) -> dict:
+    \"\"\"統計情報を計算\"\"\"
+    return {
+        'mean': value,
+        'double': value * 2,
+        'square': value ** 2,
+        'sqrt': np.sqrt(abs(value)),
+        'log': np.log(value) if value > 0 else None,
+        'sin': np.sin(value),
+        'cos': np.cos(value)
+    }
+
+def main():
+    st.title("Number Input Calculator")
+    
+    # メイン入力
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        number = st.number_input(
+            $params
+        )
+    
+    with col2:
+        operation = st.selectbox(
+            "演算",
+            ["加算", "減算", "乗算", "除算", "べき乗"]
+        )
+        
+        operand = st.number_input(
+            "演算子",
+            value=2.0
+        )
+    
+    # 計算実行
+    if operation == "加算":
+        result = number + operand
+    elif operation == "減算":
+        result = number - operand
+    elif operation == "乗算":
+        result = number * operand
+    elif operation == "除算":
+        result = number / operand if operand != 0 else "エラー: ゼロ除算"
+    else:  # べき乗
+        result = number ** operand
+    
+    # 結果表示
+    st.subheader("計算結果")
+    if isinstance(result, (int, float)):
+        st.success(f"{number} {operation} {operand} = {result}")
+        
+        # 統計情報
+        stats = calculate_statistics(result)
+        
+        cols = st.columns(4)
+        for i, (key, value) in enumerate(stats.items()):
+            if value is not None:
+                cols[i % 4].metric(key.title(), f"{value:.4f}")
+    else:
+        st.error(result)
+    
+    # データ履歴
+    if 'history' not in st.session_state:
+        st.session_state.history = []
+    
+    if st.button("履歴に追加"):
+        st.session_state.history.append({
+            'number': number,
+            'operation': operation,
+            'operand': operand,
+            'result': result if isinstance(result, (int, float)) else None
+        })
+    
+    if st.session_state.history:
+        st.subheader("計算履歴")
+        df = pd.DataFrame(st.session_state.history)
+        st.dataframe(df)
+        
+        if st.button("履歴をクリア"):
+            st.session_state.history = []
+            st.rerun()
+
+if __name__ == "__main__":
+    main()""")
+
+
+# コード生成
+def _format_params(params_items: Tuple[Tuple[str, Any], ...]) -> str:
+    """コード用にパラメータをフォーマット（並び順を保った (キー, 値) のタプルで受け取る）"""
+    return ',\n'.join(
+        f'    {key}="{value}"' if isinstance(value, str) else f'    {key}={value}'
+        for key, value in params_items
+    )
+
+
+@st.cache_data(ttl=None, max_entries=128, show_spinner=False)
+def _build_code(level: str, params_items: Tuple[Tuple[str, Any], ...]) -> str:
+    """
+    number_input のコードを生成
+    
+    params は並び順を保ったタプルで受け取り、同じパラメータでの再実行時は
+    キャッシュから返す
+    """
+    clean_params = dict(params_items)
+    
+    if level == "basic":
+        from utils.code_display import code_display
+        return code_display.format_code("st.number_input", clean_params, level="basic")
+    
+    elif level == "advanced":
+        return _ADVANCED_TPL.substitute(
+            params=_format_params(params_items),
+            min_value=clean_params.get('min_value', 0),
+            max_value=clean_params.get('max_value', 100)
+        )
+    
+    else:  # full
+        return _FULL_TPL.substitute(params=_format_params(params_items))
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _analyze_number(result: float, min_value: float, max_value: float) -> Dict[str, Any]:
+    """「数値の詳細」に表示する値をまとめて計算（同じ入力ならキャッシュから返す）"""
+    int_part = int(result)
+    return {
+        'abs': abs(result),
+        'sign': '正' if result > 0 else '負' if result < 0 else 'ゼロ',
+        'int_part': int_part,
+        'frac_part': result - int_part,
+        'hex': hex(int_part),
+        'bin': bin(int_part),
+        'progress': (result - min_value) / (max_value - min_value) if max_value > min_value else 0
+    }
 
 
 class NumberInputComponent(BaseComponent):
     """st.number_input コンポーネント"""
     
+    _METADATA = MappingProxyType({
+        'id': 'number_input',
+        'name': 'st.number_input',
+        'category': 'input_widgets',
+        'description': '数値入力フィールド。整数または浮動小数点数の入力を受け付ける。',
+        'parameters': [
+            {
+                'name': 'label',
+                'type': 'str',
+                'required': True,
+                'default': 'Enter a number',
+                'description': '入力フィールドのラベル'
+            },
+            {
+                'name': 'min_value',
+                'type': 'float/int',
+                'required': False,
+                'default': None,
+                'description': '最小値'
+            },
+            {
+                'name': 'max_value',
+                'type': 'float/int',
+                'required': False,
+                'default': None,
+                'description': '最大値'
+            },
+            {
+                'name': 'value',
+                'type': 'float/int',
+                'required': False,
+                'default': 'min_value or 0',
+                'description': 'デフォルト値'
+            },
+            {
+                'name': 'step',
+                'type': 'float/int',
+                'required': False,
+                'default': 1,
+                'description': '増減ステップ'
+            },
+            {
+                'name': 'format',
+                'type': 'str',
+                'required': False,
+                'default': None,
+                'description': '表示フォーマット（printf形式）'
+            },
+            {
+                'name': 'key',
+                'type': 'str',
+                'required': False,
+                'default': None,
+                'description': 'ウィジェットの一意識別子'
+            },
+            {
+                'name': 'help',
+                'type': 'str',
+                'required': False,
+                'default': None,
+                'description': 'ヘルプテキスト'
+            },
+            {
+                'name': 'placeholder',
+                'type': 'str',
+                'required': False,
+                'default': None,
+                'description': 'プレースホルダーテキスト'
+            },
+            {
+                'name': 'disabled',
+                'type': 'bool',
+                'required': False,
+                'default': False,
+                'description': '入力を無効化'
+            },
+            {
+                'name': 'label_visibility',
+                'type': 'str',
+                'required': False,
+                'default': 'visible',
+                'description': 'ラベルの表示設定'
+            }
+        ],
+        'tips': [
+            'stepパラメータで増減の単位を設定可能',
+            'format="%d"で整数表示、format="%.2f"で小数点2桁表示',
+            'min_value/max_valueで入力範囲を制限',
+            '矢印キーまたは+/-ボタンで値を調整',
+            'value引数にintを渡すと整数モード、floatを渡すと小数モード'
+        ],
+        'related': ['slider', 'text_input', 'metric'],
+        'version_added': '0.1.0'
+    })
+    
     def __init__(self):
         super().__init__("number_input", "input_widgets")
-        self.metadata = {
-            'id': 'number_input',
-            'name': 'st.number_input',
-            'category': 'input_widgets',
-            'description': '数値入力フィールド。整数または浮動小数点数の入力を受け付ける。',
-            'parameters': [
-                {
-                    'name': 'label',
-                    'type': 'str',
-                    'required': True,
-                    'default': 'Enter a number',
-                    'description': '入力フィールドのラベル'
-                },
-                {
-                    'name': 'min_value',
-                    'type': 'float/int',
-                    'required': False,
-                    'default': None,
-                    'description': '最小値'
-                },
-                {
-                    'name': 'max_value',
-                    'type': 'float/int',
-                    'required': False,
-                    'default': None,
-                    'description': '最大値'
-                },
-                {
-                    'name': 'value',
-                    'type': 'float/int',
-                    'required': False,
-                    'default': 'min_value or 0',
-                    'description': 'デフォルト値'
-                },
-                {
-                    'name': 'step',
-                    'type': 'float/int',
-                    'required': False,
-                    'default': 1,
-                    'description': '増減ステップ'
-                },
-                {
-                    'name': 'format',
-                    'type': 'str',
-                    'required': False,
-                    'default': None,
-                    'description': '表示フォーマット（printf形式）'
-                },
-                {
-                    'name': 'key',
-                    'type': 'str',
-                    'required': False,
-                    'default': None,
-                    'description': 'ウィジェットの一意識別子'
-                },
-                {
-                    'name': 'help',
-                    'type': 'str',
-                    'required': False,
-                    'default': None,
-                    'description': 'ヘルプテキスト'
-                },
-                {
-                    'name': 'placeholder',
-                    'type': 'str',
-                    'required': False,
-                    'default': None,
-                    'description': 'プレースホルダーテキスト'
-                },
-                {
-                    'name': 'disabled',
-                    'type': 'bool',
-                    'required': False,
-                    'default': False,
-                    'description': '入力を無効化'
-                },
-                {
-                    'name': 'label_visibility',
-                    'type': 'str',
-                    'required': False,
-                    'default': 'visible',
-                    'description': 'ラベルの表示設定'
-                }
-            ],
-            'tips': [
-                'stepパラメータで増減の単位を設定可能',
-                'format="%d"で整数表示、format="%.2f"で小数点2桁表示',
-                'min_value/max_valueで入力範囲を制限',
-                '矢印キーまたは+/-ボタンで値を調整',
-                'value引数にintを渡すと整数モード、floatを渡すと小数モード'
-            ],
-            'related': ['slider', 'text_input', 'metric'],
-            'version_added': '0.1.0'
-        }
+        self.metadata = self._METADATA
     
     def render_demo(self) -> Any:
         """デモをレンダリング"""
@@ -252,24 +413,25 @@ class NumberInputComponent(BaseComponent):
         
         # 詳細分析
         with st.expander("🔍 数値の詳細"):
+            analysis = _analyze_number(result, min_value, max_value)
             st.write("**値の情報:**")
-            st.write(f"- 絶対値: {abs(result)}")
-            st.write(f"- 符号: {'正' if result > 0 else '負' if result < 0 else 'ゼロ'}")
+            st.write(f"- 絶対値: {analysis['abs']}")
+            st.write(f"- 符号: {analysis['sign']}")
             if isinstance(result, float):
-                st.write(f"- 整数部: {int(result)}")
-                st.write(f"- 小数部: {result - int(result):.4f}")
-            st.write(f"- 16進数: {hex(int(result))}")
-            st.write(f"- 2進数: {bin(int(result))}")
+                st.write(f"- 整数部: {analysis['int_part']}")
+                st.write(f"- 小数部: {analysis['frac_part']:.4f}")
+            st.write(f"- 16進数: {analysis['hex']}")
+            st.write(f"- 2進数: {analysis['bin']}")
             
             # 範囲チェック
             st.write("**範囲チェック:**")
-            progress = (result - min_value) / (max_value - min_value) if max_value > min_value else 0
-            st.progress(progress)
-            st.write(f"範囲内の位置: {progress:.1%}")
+            st.progress(analysis['progress'])
+            st.write(f"範囲内の位置: {analysis['progress']:.1%}")
         
         # コード表示
         st.divider()
         st.subheader("💻 生成されたコード")
+        from utils.code_display import code_display
         code = self.get_code("basic", params)
         code_display.display_with_copy(code, key=f"{self.id}_demo_code")
         
@@ -289,139 +451,11 @@ class NumberInputComponent(BaseComponent):
         # keyパラメータを除外
         clean_params = {k: v for k, v in params.items() if v is not None and k != 'key'}
         
-        if level == "basic":
-            return code_display.format_code("st.number_input", clean_params, level="basic")
-        
-        elif level == "advanced":
-            advanced_code = f"""
-import streamlit as st
-
-# 数値入力と計算
-number = st.number_input(
-    {self._format_params_for_code(clean_params)}
-)
-
-# 計算結果
-col1, col2, col3 = st.columns(3)
-with col1:
-    st.metric("2倍", number * 2)
-with col2:
-    st.metric("平方", number ** 2)
-with col3:
-    st.metric("平方根", number ** 0.5 if number >= 0 else "N/A")
-
-# 範囲チェック
-if number < {clean_params.get('min_value', 0)}:
-    st.error("値が小さすぎます")
-elif number > {clean_params.get('max_value', 100)}:
-    st.error("値が大きすぎます")
-else:
-    st.success(f"有効な値: {{number}}")
-"""
-            return advanced_code.strip()
-        
-        else:  # full
-            full_code = f"""
-import streamlit as st
-import pandas as pd
-import numpy as np
-
-def calculate_statistics(value: float) -> dict:
-    \"\"\"統計情報を計算\"\"\"
-    return {{
-        'mean': value,
-        'double': value * 2,
-        'square': value ** 2,
-        'sqrt': np.sqrt(abs(value)),
-        'log': np.log(value) if value > 0 else None,
-        'sin': np.sin(value),
-        'cos': np.cos(value)
-    }}
-
-def main():
-    st.title("Number Input Calculator")
-    
-    # メイン入力
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        number = st.number_input(
-            {self._format_params_for_code(clean_params)}
-        )
-    
-    with col2:
-        operation = st.selectbox(
-            "演算",
-            ["加算", "減算", "乗算", "除算", "べき乗"]
-        )
-        
-        operand = st.number_input(
-            "演算子",
-            value=2.0
-        )
-    
-    # 計算実行
-    if operation == "加算":
-        result = number + operand
-    elif operation == "減算":
-        result = number - operand
-    elif operation == "乗算":
-        result = number * operand
-    elif operation == "除算":
-        result = number / operand if operand != 0 else "エラー: ゼロ除算"
-    else:  # べき乗
-        result = number ** operand
-    
-    # 結果表示
-    st.subheader("計算結果")
-    if isinstance(result, (int, float)):
-        st.success(f"{{number}} {{operation}} {{operand}} = {{result}}")
-        
-        # 統計情報
-        stats = calculate_statistics(result)
-        
-        cols = st.columns(4)
-        for i, (key, value) in enumerate(stats.items()):
-            if value is not None:
-                cols[i % 4].metric(key.title(), f"{{value:.4f}}")
-    else:
-        st.error(result)
-    
-    # データ履歴
-    if 'history' not in st.session_state:
-        st.session_state.history = []
-    
-    if st.button("履歴に追加"):
-        st.session_state.history.append({{
-            'number': number,
-            'operation': operation,
-            'operand': operand,
-            'result': result if isinstance(result, (int, float)) else None
-        }})
-    
-    if st.session_state.history:
-        st.subheader("計算履歴")
-        df = pd.DataFrame(st.session_state.history)
-        st.dataframe(df)
-        
-        if st.button("履歴をクリア"):
-            st.session_state.history = []
-            st.rerun()
-
-if __name__ == "__main__":
-    main()
-"""
-            return full_code.strip()
+        return _build_code(level, tuple(clean_params.items()))
     
     def _format_params_for_code(self, params: Dict) -> str:
         """コード用にパラメータをフォーマット"""
-        lines = []
-        for key, value in params.items():
-            if isinstance(value, str):
-                lines.append(f'    {key}="{value}"')
-            else:
-                lines.append(f'    {key}={value}')
-        return ',\n'.join(lines)
+        return _format_params(tuple(params.items()))
 
 
 # コンポーネントのエクスポート
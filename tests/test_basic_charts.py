@@ -164,6 +164,10 @@ class TestChartDataGenerator:
         # インデックスがDatetimeIndexであることを確認
         assert isinstance(data.index, pd.DatetimeIndex)
         
+        # 時刻が1秒間隔で昇順に並んでいることを確認
+        assert data.index.is_monotonic_increasing
+        assert (data.index.to_series().diff().dropna() == pd.Timedelta(seconds=1)).all()
+        
         # カスタムパラメータでのテスト
         data = generator.generate_realtime_data(
             columns=["A", "B", "C"],
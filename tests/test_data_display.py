@@ -0,0 +1,80 @@
+"""
+データ表示コンポーネントのテスト
+"""
+
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# プロジェクトルートをパスに追加
+root_path = Path(__file__).parent.parent
+sys.path.insert(0, str(root_path))
+
+# Streamlitをモック化
+sys.modules['streamlit'] = MagicMock()
+
+from components.data_widgets.data_display import JsonComponent
+
+
+class TestSafeJson:
+    """JsonComponent.safe_jsonのテスト"""
+
+    @pytest.mark.parametrize("value", [1, 1.5, "text", True, None])
+    def test_scalar_passthrough(self, value):
+        """スカラー値はそのまま返すテスト"""
+        assert JsonComponent.safe_json(value) is value
+
+    def test_list_truncation(self):
+        """リストがmax_itemsで切り詰められるテスト"""
+        result = JsonComponent.safe_json(list(range(10)), max_items=3)
+
+        assert result == [0, 1, 2, "…(7 more)"]
+
+    def test_list_within_limit(self):
+        """上限以内のリストには省略表示を付けないテスト"""
+        assert JsonComponent.safe_json([1, 2, 3], max_items=3) == [1, 2, 3]
+
+    def test_tuple_becomes_list(self):
+        """タプルはリストとして返すテスト"""
+        assert JsonComponent.safe_json((1, 2)) == [1, 2]
+
+    def test_max_depth_replacement(self):
+        """max_depthより深いコンテナが置き換えられるテスト"""
+        data = {"a": {"b": {"c": [1, 2]}, "x": 1}}
+        result = JsonComponent.safe_json(data, max_depth=2)
+
+        assert result == {"a": {"b": "…", "x": 1}}
+
+    def test_key_order_preserved(self):
+        """辞書のキーの順序が保たれるテスト"""
+        data = {"z": 1, "a": 2, "m": {"y": 3, "b": 4}}
+        result = JsonComponent.safe_json(data)
+
+        assert list(result) == ["z", "a", "m"]
+        assert list(result["m"]) == ["y", "b"]
+
+    def test_does_not_modify_input(self):
+        """元のデータを変更しないテスト"""
+        data = {"items": list(range(5))}
+        JsonComponent.safe_json(data, max_items=2)
+
+        assert data == {"items": list(range(5))}
+
+    def test_deep_nesting_beyond_recursion_limit(self):
+        """再帰上限を超える深さのネストでもエラーにならないテスト"""
+        depth = sys.getrecursionlimit() + 100
+        data = {}
+        node = data
+        for _ in range(depth):
+            node["child"] = {}
+            node = node["child"]
+
+        result = JsonComponent.safe_json(data, max_depth=depth + 1)
+
+        levels = 0
+        node = result
+        while node:
+            node = node["child"]
+            levels += 1
+        assert levels == depth
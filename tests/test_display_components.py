@@ -14,6 +14,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path.cwd()))
 
 try:
+    from components.base_component import get_component
     from components.display_widgets.text_display import (
         WriteComponent,
         MarkdownComponent,
@@ -30,23 +31,23 @@ try:
     
     with tab1:
         st.header("st.write")
-        WriteComponent().render_demo()
+        get_component(WriteComponent).render_demo()
     
     with tab2:
         st.header("st.markdown")
-        MarkdownComponent().render_demo()
+        get_component(MarkdownComponent).render_demo()
     
     with tab3:
         st.header("見出し系")
-        HeadingComponents().render_demo()
+        get_component(HeadingComponents).render_demo()
     
     with tab4:
         st.header("st.code")
-        CodeComponent().render_demo()
+        get_component(CodeComponent).render_demo()
         
     with tab5:
         st.header("メッセージ系")
-        MessageComponents().render_demo()
+        get_component(MessageComponents).render_demo()
         
 except Exception as e:
     st.error(f"Error: {e}")
@@ -17,6 +17,7 @@ st.title("📝 入力ウィジェット コンポーネントテスト")
 
 # 各モジュールからインポート
 try:
+    from components.base_component import get_component
     from components.input_widgets.text_inputs import TextInputComponent, TextAreaComponent
     from components.input_widgets.numeric_inputs import NumberInputComponent
     from components.input_widgets.date_time_inputs import DateInputComponent, TimeInputComponent
@@ -26,19 +27,19 @@ try:
     ])
     
     with tab1:
-        TextInputComponent().render_demo()
+        get_component(TextInputComponent).render_demo()
     
     with tab2:
-        TextAreaComponent().render_demo()
+        get_component(TextAreaComponent).render_demo()
     
     with tab3:
-        NumberInputComponent().render_demo()
+        get_component(NumberInputComponent).render_demo()
     
     with tab4:
-        DateInputComponent().render_demo()
+        get_component(DateInputComponent).render_demo()
     
     with tab5:
-        TimeInputComponent().render_demo()
+        get_component(TimeInputComponent).render_demo()
         
 except Exception as e:
     st.error(f"Error: {e}")
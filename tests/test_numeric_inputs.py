@@ -0,0 +1,45 @@
+"""
+数値入力コンポーネントのテスト
+"""
+
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# プロジェクトルートをパスに追加
+root_path = Path(__file__).parent.parent
+sys.path.insert(0, str(root_path))
+
+# Streamlitをモック化
+sys.modules['streamlit'] = MagicMock()
+
+from components.input_widgets.numeric_inputs import NumberInputComponent
+
+
+class TestFormatParamsForCode:
+    """NumberInputComponent._format_params_for_codeのテスト"""
+
+    @pytest.fixture
+    def component(self):
+        """テスト用コンポーネント"""
+        return NumberInputComponent()
+
+    def test_int_then_float_params(self, component):
+        """int のパラメータの後に float を渡しても float の表記になるテスト"""
+        int_code = component._format_params_for_code({'value': 1, 'step': 1})
+        float_code = component._format_params_for_code({'value': 1.0, 'step': 1.0})
+
+        assert int_code == '    value=1,\n    step=1'
+        assert float_code == '    value=1.0,\n    step=1.0'
+
+    def test_bool_and_int_params(self, component):
+        """True と 1 を区別して出力するテスト"""
+        assert component._format_params_for_code({'value': 1}) == '    value=1'
+        assert component._format_params_for_code({'value': True}) == '    value=True'
+
+    def test_string_params_quoted(self, component):
+        """文字列パラメータが引用符付きで出力されるテスト"""
+        code = component._format_params_for_code({'label': 'Enter', 'value': 5})
+
+        assert code == '    label="Enter",\n    value=5'
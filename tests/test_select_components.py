@@ -14,6 +14,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path.cwd()))
 
 try:
+    from components.base_component import get_component
     from components.select_widgets.basic_selects import (
         CheckboxComponent,
         RadioComponent,
@@ -29,19 +30,19 @@ try:
     
     with tab1:
         st.header("st.checkbox")
-        CheckboxComponent().render_demo()
+        get_component(CheckboxComponent).render_demo()
     
     with tab2:
         st.header("st.radio")
-        RadioComponent().render_demo()
+        get_component(RadioComponent).render_demo()
     
     with tab3:
         st.header("st.selectbox")
-        SelectboxComponent().render_demo()
+        get_component(SelectboxComponent).render_demo()
     
     with tab4:
         st.header("st.multiselect")
-        MultiselectComponent().render_demo()
+        get_component(MultiselectComponent).render_demo()
         
 except Exception as e:
     st.error(f"Error: {e}")
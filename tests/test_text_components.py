@@ -20,6 +20,7 @@ else:
 
 # インポート試行
 try:
+    from components.base_component import get_component
     from components.input_widgets.text_inputs import TextInputComponent, TextAreaComponent
     import_success = True
 except ImportError as e:
@@ -45,7 +46,7 @@ if import_success:
     with tab1:
         st.header("st.text_input")
         try:
-            text_input_component = TextInputComponent()
+            text_input_component = get_component(TextInputComponent)
             text_input_component.render_demo()
         except Exception as e:
             st.error(f"コンポーネントエラー: {e}")
@@ -54,7 +55,7 @@ if import_success:
     with tab2:
         st.header("st.text_area")
         try:
-            text_area_component = TextAreaComponent()
+            text_area_component = get_component(TextAreaComponent)
             text_area_component.render_demo()
         except Exception as e:
             st.error(f"コンポーネントエラー: {e}")
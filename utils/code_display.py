@@ -7,6 +7,7 @@ import streamlit as st
 from typing import Dict, List, Optional, Any
 import textwrap
 import re
+import hashlib
 
 class CodeDisplay:
     """コード表示管理クラス"""
@@ -14,6 +15,8 @@ class CodeDisplay:
     def __init__(self):
         """初期化"""
         self.templates = self._load_templates()
+        # content_hash -> エンコード済みコード（ダウンロード用）
+        self._encoded_cache: Dict[str, bytes] = {}
     
     def _load_templates(self) -> Dict[str, str]:
         """コードテンプレートを定義"""
@@ -267,7 +270,8 @@ class CodeDisplay:
     def display_with_copy(self, 
                          code: str,
                          language: str = "python",
-                         key: Optional[str] = None) -> None:
+                         key: Optional[str] = None,
+                         content_hash: Optional[str] = None) -> None:
         """
         コピー機能付きでコードを表示
         
@@ -275,19 +279,30 @@ class CodeDisplay:
             code: 表示するコード
             language: プログラミング言語
             key: ボタンのユニークキー
+            content_hash: 事前計算したコードのハッシュ（compute_content_hash の戻り値）
+                指定時はエンコード済みのコードを使い回し、key 未指定時のキーにも使う
         """
         # Streamlitのコード表示（最新版では自動的にコピーボタンが付く）
         st.code(code, language=language)
         
+        if content_hash is not None:
+            data = self._encoded_cache.get(content_hash)
+            if data is None:
+                data = self._encoded_cache[content_hash] = code.encode("utf-8")
+            button_key = f"download_{key or content_hash}"
+        else:
+            data = code
+            button_key = f"download_{key}" if key else None
+        
         # 追加オプション：ダウンロードボタン
         col1, col2 = st.columns([1, 4])
         with col1:
             st.download_button(
                 label="📥 ダウンロード",
-                data=code,
+                data=data,
                 file_name=f"code_{key}.py" if key else "code.py",
                 mime="text/plain",
-                key=f"download_{key}" if key else None
+                key=button_key
             )
         with col2:
             st.caption("💡 コードブロック右上のボタンでコピー、または左のボタンでダウンロード")
@@ -357,5 +372,15 @@ class CodeDisplay:
         return None
 
 
+def compute_content_hash(code: str) -> str:
+    """
+    コードのハッシュを計算
+    
+    固定のコード文字列に対してクラス定義時などに一度だけ呼び出し、
+    display_with_copy の content_hash に渡す
+    """
+    return hashlib.md5(code.encode("utf-8")).hexdigest()
+
+
 # グローバルインスタンス
 code_display = CodeDisplay()
\ No newline at end of file
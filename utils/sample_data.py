@@ -3,13 +3,15 @@
 デモ用のサンプルデータを生成するユーティリティ
 """
 
-import pandas as pd
-import numpy as np
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, TYPE_CHECKING
 import random
 import string
 
+# pandas / numpy は起動時間短縮のため使用時に遅延インポートする
+if TYPE_CHECKING:
+    import pandas as pd
+
 class SampleDataGenerator:
     """サンプルデータ生成クラス"""
     
@@ -21,12 +23,20 @@ class SampleDataGenerator:
             seed: 乱数シード
         """
         self.seed = seed
-        np.random.seed(seed)
+        self._np_seeded = False
         random.seed(seed)
     
+    def _numpy(self):
+        """NumPy を遅延インポート（初回のみ乱数シードを設定）"""
+        import numpy as np
+        if not self._np_seeded:
+            np.random.seed(self.seed)
+            self._np_seeded = True
+        return np
+    
     def generate_dataframe(self, 
                           rows: int = 100,
-                          columns: Optional[List[str]] = None) -> pd.DataFrame:
+                          columns: Optional[List[str]] = None) -> "pd.DataFrame":
         """
         サンプルDataFrameを生成
         
@@ -37,6 +47,9 @@ class SampleDataGenerator:
         Returns:
             生成されたDataFrame
         """
+        np = self._numpy()
+        import pandas as pd
+        
         if columns is None:
             columns = ['ID', 'Name', 'Age', 'Score', 'Date', 'Category']
         
@@ -64,7 +77,7 @@ class SampleDataGenerator:
     
     def generate_time_series(self, 
                            days: int = 30,
-                           freq: str = 'D') -> pd.DataFrame:
+                           freq: str = 'D') -> "pd.DataFrame":
         """
         時系列データを生成
         
@@ -75,6 +88,9 @@ class SampleDataGenerator:
         Returns:
             時系列DataFrame
         """
+        np = self._numpy()
+        import pandas as pd
+        
         dates = pd.date_range(start=datetime.now() - timedelta(days=days),
                              end=datetime.now(),
                              freq=freq)
@@ -90,7 +106,7 @@ class SampleDataGenerator:
     
     def generate_chart_data(self, 
                           chart_type: str = 'line',
-                          points: int = 50) -> pd.DataFrame:
+                          points: int = 50) -> "pd.DataFrame":
         """
         チャート用データを生成
         
@@ -101,6 +117,9 @@ class SampleDataGenerator:
         Returns:
             チャート用DataFrame
         """
+        np = self._numpy()
+        import pandas as pd
+        
         x = np.linspace(0, 10, points)
         
         if chart_type == 'line':
@@ -215,21 +234,25 @@ class SampleDataGenerator:
         """
         return {
             "revenue": {
+                "label": "売上",
                 "value": f"¥{random.randint(1000000, 9999999):,}",
                 "delta": f"{random.uniform(-10, 20):.1f}%",
                 "delta_color": "normal"
             },
             "users": {
+                "label": "ユーザー数",
                 "value": f"{random.randint(1000, 50000):,}",
                 "delta": f"+{random.randint(10, 500)}",
                 "delta_color": "normal"
             },
             "conversion": {
+                "label": "コンバージョン率",
                 "value": f"{random.uniform(1, 5):.2f}%",
                 "delta": f"{random.uniform(-0.5, 0.5):.2f}%",
                 "delta_color": "normal"
             },
             "satisfaction": {
+                "label": "満足度",
                 "value": f"{random.uniform(4.0, 5.0):.1f}/5.0",
                 "delta": f"+{random.uniform(0, 0.3):.1f}",
                 "delta_color": "normal"